@@ -2,14 +2,94 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import httpx
+import orjson
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = True
+except ImportError:  # Optional: pip install "triagent[fast]"
+    _HAS_MSGSPEC = False
 
 from triagent.config import TriagentCredentials
+from triagent.tools.error_recovery import ErrorContext, classify_http_error
 
 if TYPE_CHECKING:
-    from triagent.tools.error_recovery import ErrorContext
+    from types import TracebackType
+
+# orjson encodes to bytes and decodes bytes directly, avoiding the stdlib
+# json round-trip httpx uses for json= and response.json().
+_dumps = orjson.dumps
+_loads = orjson.loads
+
+_TIMEOUT = 120
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60)
+
+
+@dataclass(slots=True)
+class ParsedResponse:
+    """Text and tool calls extracted from one Anthropic-style response."""
+
+    text: str = ""
+    tool_calls: list[dict] = field(default_factory=list)
+    has_tool_calls: bool = False
+
+
+@dataclass(slots=True)
+class _ParseState:
+    """Accumulators used while walking response content blocks."""
+
+    text_parts: list[str] = field(default_factory=list)
+    tool_calls: list[dict] = field(default_factory=list)
+
+
+def _on_text(block: dict, state: _ParseState) -> None:
+    """Collect the text of a text block."""
+    state.text_parts.append(block.get("text", ""))
+
+
+def _on_tool_use(block: dict, state: _ParseState) -> None:
+    """Collect a tool_use block as a tool call dictionary."""
+    state.tool_calls.append({
+        "id": block.get("id", ""),
+        "name": block.get("name", ""),
+        "arguments": block.get("input", {}),
+    })
+
+
+# Content block type -> handler; new block types only need registering here
+_BLOCK_HANDLERS: dict[str, Callable[[dict, _ParseState], None]] = {
+    "text": _on_text,
+    "tool_use": _on_tool_use,
+}
+
+
+if _HAS_MSGSPEC:
+
+    class _TextBlockStruct(msgspec.Struct, tag="text", tag_field="type"):
+        """Text content block."""
+
+        text: str = ""
+
+    class _ToolUseBlockStruct(msgspec.Struct, tag="tool_use", tag_field="type"):
+        """Tool use content block."""
+
+        id: str = ""
+        name: str = ""
+        input: dict = {}
+
+    class _ResponseStruct(msgspec.Struct):
+        """Typed view of the fields read from an Anthropic-format response."""
+
+        content: list[_TextBlockStruct | _ToolUseBlockStruct] = []
+
+    # Block type is dispatched by msgspec at decode time via the "type" tag
+    _response_decoder = msgspec.json.Decoder(_ResponseStruct)
 
 
 class AzureFoundryClient:
@@ -25,12 +105,193 @@ class AzureFoundryClient:
         self.model = credentials.anthropic_foundry_model
         self.api_key = credentials.anthropic_foundry_api_key
 
+        # Static per-client headers, built once rather than per request
+        self._headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            # Verbose JSON compresses well; httpx decodes zstd via the extra
+            "Accept-Encoding": "zstd, gzip",
+        }
+
+        # Pooled HTTP/2 client so sequential turns reuse one TLS connection
+        self._client = httpx.Client(
+            http2=True,
+            timeout=_TIMEOUT,
+            limits=_POOL_LIMITS,
+            headers=self._headers,
+        )
+        # Pooled async connections are bound to the event loop that opened
+        # them, so this is only set inside "async with client:"
+        self._aclient: httpx.AsyncClient | None = None
+
+    def _new_async_client(self) -> httpx.AsyncClient:
+        """Create an HTTP/2 AsyncClient for the current event loop."""
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=_TIMEOUT,
+            limits=_POOL_LIMITS,
+            headers=self._headers,
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """Close the async HTTP connection pool, if one is open."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def __enter__(self) -> AzureFoundryClient:
+        """Enter context manager, returning this client."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager, closing the connection pool."""
+        self.close()
+
+    async def __aenter__(self) -> AzureFoundryClient:
+        """Open an async connection pool shared by asend_message calls."""
+        self._aclient = self._new_async_client()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the async connection pool opened by __aenter__."""
+        await self.aclose()
+
+    def _build_body(
+        self,
+        messages: list[dict],
+        system: str | None,
+        max_tokens: int,
+        tools: list[dict] | None,
+    ) -> dict:
+        """Build an Anthropic-format request body."""
+        body: dict = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+        }
+
+        # Add system prompt if provided
+        if system:
+            body["system"] = system
+
+        # Add tools if provided (Anthropic format)
+        if tools:
+            body["tools"] = tools
+
+        return body
+
+    def _post(self, body: dict | bytes) -> tuple[httpx.Response, ErrorContext | None]:
+        """POST a request body to the Foundry endpoint.
+
+        Args:
+            body: Anthropic-format request body, or its already-encoded bytes
+
+        Returns:
+            Tuple of (response, error_context); error_context is None on success
+        """
+        content = body if isinstance(body, bytes) else _dumps(body)
+        response = self._client.post(self.base_url, content=content)
+        # Check the status directly rather than raising and catching
+        if response.is_success:
+            return response, None
+
+        error_type = classify_http_error(response.status_code, response.text)
+        return response, ErrorContext(
+            status_code=response.status_code,
+            error_message=response.text,
+            error_type=error_type,
+        )
+
+    def _stream(
+        self,
+        body: dict,
+        on_delta: Callable[[dict], None] | None = None,
+    ) -> dict:
+        """POST a streaming request and rebuild the full response from events.
+
+        Args:
+            body: Anthropic-format request body
+            on_delta: Optional callback invoked with each content_block_delta
+                event as it arrives
+
+        Returns:
+            Response dictionary equivalent to the non-streaming API result
+        """
+        body["stream"] = True
+        message: dict = {"content": []}
+        content: list[dict] = message["content"]
+        # Text and tool input arrive in pieces; collect them per block index
+        # and join once at content_block_stop instead of re-concatenating
+        text_parts: dict[int, list[str]] = {}
+        partial_json: dict[int, list[str]] = {}
+
+        with self._client.stream("POST", self.base_url, content=_dumps(body)) as response:
+            if response.is_error:
+                response.read()
+                response.raise_for_status()
+
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                event = _loads(line[5:])
+                event_type = event.get("type")
+
+                if event_type == "content_block_delta":
+                    delta = event["delta"]
+                    index = event["index"]
+                    if delta.get("type") == "text_delta":
+                        text_parts.setdefault(index, []).append(delta.get("text", ""))
+                    elif delta.get("type") == "input_json_delta":
+                        partial_json.setdefault(index, []).append(
+                            delta.get("partial_json", "")
+                        )
+                    if on_delta is not None:
+                        on_delta(event)
+                elif event_type == "content_block_start":
+                    content.append(dict(event["content_block"]))
+                elif event_type == "content_block_stop":
+                    index = event["index"]
+                    texts = text_parts.pop(index, None)
+                    if texts:
+                        content[index]["text"] += "".join(texts)
+                    parts = partial_json.pop(index, None)
+                    if parts:
+                        content[index]["input"] = _loads("".join(parts))
+                elif event_type == "message_start":
+                    message.update(event["message"])
+                    message["content"] = content
+                elif event_type == "message_delta":
+                    message.update(event.get("delta", {}))
+                    if "usage" in event:
+                        message.setdefault("usage", {}).update(event["usage"])
+                elif event_type == "error":
+                    raise RuntimeError(f"Stream error: {event.get('error')}")
+
+        return message
+
     def send_message(
         self,
         messages: list[dict],
         system: str | None = None,
         max_tokens: int = 4096,
         tools: list[dict] | None = None,
+        stream: bool = False,
+        on_delta: Callable[[dict], None] | None = None,
     ) -> dict:
         """Send a message to Azure Foundry Claude endpoint.
 
@@ -39,35 +300,83 @@ class AzureFoundryClient:
             system: Optional system prompt
             max_tokens: Maximum tokens to generate
             tools: Optional list of tool definitions
+            stream: Consume the response as server-sent events instead of
+                buffering the whole JSON body
+            on_delta: With stream=True, called for each content_block_delta
+                event as it arrives
 
         Returns:
             Full response dictionary from the API (Anthropic format)
         """
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01",
-        }
+        body = self._build_body(messages, system, max_tokens, tools)
+        if stream:
+            return self._stream(body, on_delta)
 
-        # Build request body (Anthropic format)
-        body: dict = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-        }
+        response, error = self._post(body)
+        if error is not None:
+            response.raise_for_status()
 
-        # Add system prompt if provided
-        if system:
-            body["system"] = system
+        return _loads(response.content)
 
-        # Add tools if provided (Anthropic format)
-        if tools:
-            body["tools"] = tools
+    async def asend_message(
+        self,
+        messages: list[dict],
+        system: str | None = None,
+        max_tokens: int = 4096,
+        tools: list[dict] | None = None,
+    ) -> dict:
+        """Async variant of send_message for concurrent requests.
+
+        Independent calls can be overlapped with asyncio.gather. Inside
+        "async with client:" they share one pooled HTTP/2 AsyncClient tied
+        to that event loop; outside it each call uses its own client.
 
-        response = httpx.post(self.base_url, headers=headers, json=body, timeout=120)
+        Args:
+            messages: List of message dicts with role and content
+            system: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            tools: Optional list of tool definitions
+
+        Returns:
+            Full response dictionary from the API (Anthropic format)
+        """
+        content = _dumps(self._build_body(messages, system, max_tokens, tools))
+        if self._aclient is not None:
+            response = await self._aclient.post(self.base_url, content=content)
+        else:
+            async with self._new_async_client() as aclient:
+                response = await aclient.post(self.base_url, content=content)
         response.raise_for_status()
 
-        return response.json()
+        return _loads(response.content)
+
+    def send_message_parsed(
+        self,
+        messages: list[dict],
+        system: str | None = None,
+        max_tokens: int = 4096,
+        tools: list[dict] | None = None,
+    ) -> ParsedResponse:
+        """Send a message and decode the reply straight into a ParsedResponse.
+
+        Skips building the intermediate response dict when the caller only
+        needs text and tool calls.
+
+        Args:
+            messages: List of message dicts with role and content
+            system: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            tools: Optional list of tool definitions
+
+        Returns:
+            ParsedResponse with joined text and tool call dictionaries
+        """
+        body = self._build_body(messages, system, max_tokens, tools)
+        response, error = self._post(body)
+        if error is not None:
+            response.raise_for_status()
+
+        return self.parse_response_bytes(response.content)
 
     def send_message_with_error_info(
         self,
@@ -89,53 +398,129 @@ class AzureFoundryClient:
             - On success: (response, None)
             - On error: (None, ErrorContext)
         """
-        from triagent.tools.error_recovery import ErrorContext, classify_http_error
+        return self.send_encoded_with_error_info(
+            self.encode_request(messages, system, max_tokens, tools)
+        )
 
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01",
-        }
+    def encode_request(
+        self,
+        messages: list[dict],
+        system: str | None = None,
+        max_tokens: int = 4096,
+        tools: list[dict] | None = None,
+    ) -> bytes:
+        """Serialize a request body once so retries can resend the same bytes.
 
-        body: dict = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-        }
+        Args:
+            messages: List of message dicts with role and content
+            system: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            tools: Optional list of tool definitions
 
-        if system:
-            body["system"] = system
+        Returns:
+            JSON-encoded request body
+        """
+        return _dumps(self._build_body(messages, system, max_tokens, tools))
 
-        if tools:
-            body["tools"] = tools
+    def send_encoded_with_error_info(
+        self,
+        payload: bytes,
+    ) -> tuple[dict | None, ErrorContext | None]:
+        """Send a pre-encoded request body and return detailed error info.
+
+        Retry loops should encode once with encode_request and pass the same
+        payload on every attempt instead of re-serializing large tool schemas.
+
+        Args:
+            payload: Request body from encode_request
+
+        Returns:
+            Tuple of (response_dict, error_context)
+            - On success: (response, None)
+            - On error: (None, ErrorContext)
+        """
+        response, error = self._post(payload)
+        if error is not None:
+            return None, error
+        return _loads(response.content), None
+
+    def parse_response(self, response: dict) -> ParsedResponse:
+        """Extract text and tool calls from a response in a single pass.
 
+        Prefer this over calling extract_text and get_tool_calls
+        separately, which each walk the content blocks.
+
+        Args:
+            response: The API response dictionary
+
+        Returns:
+            ParsedResponse with joined text and tool call dictionaries
+        """
+        state = _ParseState()
+        handlers = _BLOCK_HANDLERS
+        for block in response.get("content", []):
+            handler = handlers.get(block.get("type"))
+            if handler is not None:
+                handler(block, state)
+        return ParsedResponse(
+            text="".join(state.text_parts),
+            tool_calls=state.tool_calls,
+            has_tool_calls=bool(state.tool_calls),
+        )
+
+    def parse_response_bytes(self, raw: bytes) -> ParsedResponse:
+        """Decode a raw response body into a ParsedResponse.
+
+        Uses typed msgspec structs when msgspec is installed. Without it, or
+        for bodies with other block types (e.g. thinking), this falls back to
+        the parse_response dict path.
+
+        Args:
+            raw: Raw JSON response body
+
+        Returns:
+            ParsedResponse with joined text and tool call dictionaries
+        """
+        if not _HAS_MSGSPEC:
+            return self.parse_response(_loads(raw))
         try:
-            response = httpx.post(self.base_url, headers=headers, json=body, timeout=120)
-            response.raise_for_status()
-            return response.json(), None
-        except httpx.HTTPStatusError as e:
-            error_type = classify_http_error(e.response.status_code, e.response.text)
-            return None, ErrorContext(
-                status_code=e.response.status_code,
-                error_message=e.response.text,
-                error_type=error_type,
-            )
+            decoded = _response_decoder.decode(raw)
+        except msgspec.ValidationError:
+            return self.parse_response(_loads(raw))
+
+        text_parts: list[str] = []
+        tool_calls: list[dict] = []
+        for block in decoded.content:
+            if isinstance(block, _TextBlockStruct):
+                text_parts.append(block.text)
+            elif isinstance(block, _ToolUseBlockStruct):
+                tool_calls.append({
+                    "id": block.id,
+                    "name": block.name,
+                    "arguments": block.input,
+                })
+        return ParsedResponse(
+            text="".join(text_parts),
+            tool_calls=tool_calls,
+            has_tool_calls=bool(tool_calls),
+        )
 
     def extract_text(self, response: dict) -> str:
         """Extract text content from Anthropic-style response.
 
+        Use parse_response instead when tool calls are needed as well.
+
         Args:
             response: The API response dictionary
 
         Returns:
             The text content from the response
         """
-        content = response.get("content", [])
-        text_parts = []
-        for block in content:
-            if block.get("type") == "text":
-                text_parts.append(block.get("text", ""))
-        return "".join(text_parts)
+        return "".join(
+            block.get("text", "")
+            for block in response.get("content", [])
+            if block.get("type") == "text"
+        )
 
     def has_tool_calls(self, response: dict) -> bool:
         """Check if the response contains tool calls.
@@ -146,8 +531,7 @@ class AzureFoundryClient:
         Returns:
             True if there are tool calls to process
         """
-        content = response.get("content", [])
-        for block in content:
+        for block in response.get("content", []):
             if block.get("type") == "tool_use":
                 return True
         return False
@@ -155,19 +539,16 @@ class AzureFoundryClient:
     def get_tool_calls(self, response: dict) -> list[dict]:
         """Extract tool calls from the response.
 
+        Use parse_response instead when the text is needed as well.
+
         Args:
             response: The API response dictionary
 
         Returns:
             List of tool call dictionaries with id, name, and arguments
         """
-        tool_calls = []
-        content = response.get("content", [])
-        for block in content:
+        state = _ParseState()
+        for block in response.get("content", []):
             if block.get("type") == "tool_use":
-                tool_calls.append({
-                    "id": block.get("id", ""),
-                    "name": block.get("name", ""),
-                    "arguments": block.get("input", {}),
-                })
-        return tool_calls
+                _on_tool_use(block, state)
+        return state.tool_calls
@@ -9,7 +9,18 @@ from __future__ import annotations
 import os
 import re
 
-from triagent.config import ConfigManager
+from triagent.config import ConfigManager, TriagentCredentials
+
+_FOUNDRY_HOST_SUFFIX = ".services.ai.azure.com"
+_FOUNDRY_RESOURCE_RE = re.compile(r"https://([^.]+)\.services\.ai\.azure\.com")
+
+# Env vars that conflict with Foundry auth in the Claude CLI
+_CONFLICTING_ENV_KEYS = frozenset(
+    {"ANTHROPIC_BASE_URL", "ANTHROPIC_AUTH_TOKEN", "ANTHROPIC_FOUNDRY_BASE_URL"}
+)
+
+# Foundry env dicts keyed by (base_url, api_key, model)
+_foundry_env_cache: dict[tuple[str, str, str], dict[str, str]] = {}
 
 
 def _extract_foundry_resource(url: str) -> str:
@@ -24,8 +35,14 @@ def _extract_foundry_resource(url: str) -> str:
     Returns:
         Resource name extracted from URL
     """
-    # Extract resource name from URL pattern: https://{resource}.services.ai.azure.com
-    match = re.search(r"https://([^.]+)\.services\.ai\.azure\.com", url)
+    # Fast path for the usual shape: https://{resource}.services.ai.azure.com/...
+    if url.startswith("https://"):
+        dot = url.find(".", 8)
+        if dot > 8 and url.startswith(_FOUNDRY_HOST_SUFFIX, dot):
+            return url[8:dot]
+
+    # Same pattern anywhere in the string (e.g. leading whitespace or a prefix)
+    match = _FOUNDRY_RESOURCE_RE.search(url)
     if match:
         return match.group(1)
 
@@ -41,35 +58,43 @@ def _extract_foundry_resource(url: str) -> str:
     return url
 
 
-def setup_sdk_environment(config_manager: ConfigManager) -> None:
+def setup_sdk_environment(credentials: TriagentCredentials) -> None:
     """Configure environment variables for Claude Agent SDK.
 
     Sets up the required environment variables based on the configured
     API provider (Azure Foundry or direct Anthropic).
 
     Args:
-        config_manager: Configuration manager instance
+        credentials: Loaded Triagent credentials
     """
-    credentials = config_manager.load_credentials()
-
     if credentials.api_provider == "azure_foundry":
         # Azure AI Foundry configuration
         # Claude CLI expects ANTHROPIC_FOUNDRY_RESOURCE (not BASE_URL)
         resource = _extract_foundry_resource(credentials.anthropic_foundry_base_url)
-        os.environ["CLAUDE_CODE_USE_FOUNDRY"] = "1"
-        os.environ["ANTHROPIC_FOUNDRY_API_KEY"] = credentials.anthropic_foundry_api_key
-        os.environ["ANTHROPIC_FOUNDRY_RESOURCE"] = resource
-        os.environ["ANTHROPIC_DEFAULT_OPUS_MODEL"] = credentials.anthropic_foundry_model
+        os.environ.update({
+            "CLAUDE_CODE_USE_FOUNDRY": "1",
+            "ANTHROPIC_FOUNDRY_API_KEY": credentials.anthropic_foundry_api_key,
+            "ANTHROPIC_FOUNDRY_RESOURCE": resource,
+            "ANTHROPIC_DEFAULT_OPUS_MODEL": credentials.anthropic_foundry_model,
+        })
 
         # Clear any conflicting env vars
-        for key in ["ANTHROPIC_BASE_URL", "ANTHROPIC_AUTH_TOKEN", "ANTHROPIC_FOUNDRY_BASE_URL"]:
-            if key in os.environ:
-                del os.environ[key]
+        for key in _CONFLICTING_ENV_KEYS:
+            os.environ.pop(key, None)
 
     # For direct Anthropic API, no special setup needed
     # SDK will use ANTHROPIC_API_KEY from environment
 
 
+def setup_sdk_environment_from(config_manager: ConfigManager) -> None:
+    """Configure SDK environment variables from a config manager.
+
+    Args:
+        config_manager: Configuration manager instance
+    """
+    setup_sdk_environment(config_manager.load_credentials())
+
+
 def get_sdk_model() -> str:
     """Get the model name for SDK configuration.
 
@@ -79,7 +104,7 @@ def get_sdk_model() -> str:
     return os.environ.get("ANTHROPIC_DEFAULT_OPUS_MODEL", "claude-sonnet-4-20250514")
 
 
-def get_foundry_env(config_manager: ConfigManager) -> dict[str, str]:
+def get_foundry_env(credentials: TriagentCredentials) -> dict[str, str]:
     """Get Azure Foundry environment variables for SDK subprocess.
 
     The Claude Agent SDK spawns Claude CLI as a subprocess. This function
@@ -87,21 +112,41 @@ def get_foundry_env(config_manager: ConfigManager) -> dict[str, str]:
     via ClaudeAgentOptions.env for reliable subprocess inheritance.
 
     Args:
-        config_manager: Configuration manager instance
+        credentials: Loaded Triagent credentials
 
     Returns:
         Dictionary of environment variables to pass to ClaudeAgentOptions.env
     """
-    credentials = config_manager.load_credentials()
-
     if credentials.api_provider == "azure_foundry":
-        # Claude CLI expects ANTHROPIC_FOUNDRY_RESOURCE (just the resource name)
-        resource = _extract_foundry_resource(credentials.anthropic_foundry_base_url)
-        return {
-            "CLAUDE_CODE_USE_FOUNDRY": "1",
-            "ANTHROPIC_FOUNDRY_API_KEY": credentials.anthropic_foundry_api_key,
-            "ANTHROPIC_FOUNDRY_RESOURCE": resource,
-            "ANTHROPIC_DEFAULT_OPUS_MODEL": credentials.anthropic_foundry_model,
-        }
+        cache_key = (
+            credentials.anthropic_foundry_base_url,
+            credentials.anthropic_foundry_api_key,
+            credentials.anthropic_foundry_model,
+        )
+        env = _foundry_env_cache.get(cache_key)
+        if env is None:
+            # Claude CLI expects ANTHROPIC_FOUNDRY_RESOURCE (just the resource name)
+            resource = _extract_foundry_resource(credentials.anthropic_foundry_base_url)
+            env = {
+                "CLAUDE_CODE_USE_FOUNDRY": "1",
+                "ANTHROPIC_FOUNDRY_API_KEY": credentials.anthropic_foundry_api_key,
+                "ANTHROPIC_FOUNDRY_RESOURCE": resource,
+                "ANTHROPIC_DEFAULT_OPUS_MODEL": credentials.anthropic_foundry_model,
+            }
+            _foundry_env_cache[cache_key] = env
+        # Return a copy; callers extend it with SSL and platform settings
+        return dict(env)
     # For direct Anthropic API, no special env vars needed
     return {}
+
+
+def get_foundry_env_from(config_manager: ConfigManager) -> dict[str, str]:
+    """Get Azure Foundry SDK environment variables from a config manager.
+
+    Args:
+        config_manager: Configuration manager instance
+
+    Returns:
+        Dictionary of environment variables to pass to ClaudeAgentOptions.env
+    """
+    return get_foundry_env(config_manager.load_credentials())
@@ -11,7 +11,19 @@ from time import time
 from typing import Any
 
 import typer
-from claude_agent_sdk import ClaudeSDKClient, CLINotFoundError, ProcessError
+from claude_agent_sdk import (
+    AssistantMessage,
+    ClaudeSDKClient,
+    CLINotFoundError,
+    ProcessError,
+    ResultMessage,
+    SystemMessage,
+    TextBlock,
+    ThinkingBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
 from rich.console import Console
 from rich.live import Live
 from rich.markdown import Markdown
@@ -192,9 +204,12 @@ class ActivityTracker:
     def buffer_text(self, text: str) -> None:
         """Buffer text for markdown or stream plain text immediately."""
         if self.markdown_enabled:
-            # Buffer for markdown rendering
+            # Buffer for markdown rendering; only rescan when this chunk
+            # (or the join with the previous one) can complete a paragraph
+            tail = self._text_buffer[-1:]
             self._text_buffer += text
-            self._flush_paragraphs()
+            if "\n\n" in tail + text:
+                self._flush_paragraphs()
         else:
             # Stream plain text immediately
             self.console.print(text, end="")
@@ -475,19 +490,15 @@ def process_sdk_message(
         console: Rich console for output
         tracker: Activity tracker for spinner/verbose output
     """
-    msg_type = type(msg).__name__
-
-    if msg_type == "AssistantMessage":
+    if isinstance(msg, AssistantMessage):
         for block in msg.content:
-            block_type = type(block).__name__
-
-            if block_type == "TextBlock":
+            if isinstance(block, TextBlock):
                 # Stop any spinner before buffering text
                 tracker.stop()
                 # Buffer text for markdown rendering
                 tracker.buffer_text(block.text)
 
-            elif block_type == "ToolUseBlock":
+            elif isinstance(block, ToolUseBlock):
                 # Start spinner for tool execution
                 tool_input = getattr(block, "input", None)
                 tool_id = getattr(block, "id", "")
@@ -512,7 +523,7 @@ def process_sdk_message(
 
                 tracker.tool_starting(block.name, tool_input)
 
-            elif block_type == "ThinkingBlock":
+            elif isinstance(block, ThinkingBlock):
                 # Show thinking spinner
                 tracker.thinking()
                 if tracker.verbose:
@@ -521,7 +532,7 @@ def process_sdk_message(
                         thinking_text += "..."
                     console.print(f"\n[dim]{thinking_text}[/dim]")
 
-            elif block_type == "ToolResultBlock":
+            elif isinstance(block, ToolResultBlock):
                 # Tool completed
                 is_error = getattr(block, "is_error", False)
                 content = (
@@ -552,7 +563,7 @@ def process_sdk_message(
                     content,
                 )
 
-    elif msg_type == "SystemMessage":
+    elif isinstance(msg, SystemMessage):
         # Handle system messages (including SDK slash command responses)
         tracker.stop()
         subtype = getattr(msg, "subtype", "")
@@ -570,7 +581,7 @@ def process_sdk_message(
             elif "output" in data:
                 console.print(data["output"])
 
-    elif msg_type == "UserMessage":
+    elif isinstance(msg, UserMessage):
         # Handle SDK slash command output (e.g., /release-notes)
         # Note: content can be a string (slash commands) or list (regular messages)
         content = getattr(msg, "content", "")
@@ -584,7 +595,7 @@ def process_sdk_message(
                 console.print(cleaned.strip())
         # List content (echoed user input) - don't stop spinner, let it continue
 
-    elif msg_type == "ResultMessage":
+    elif isinstance(msg, ResultMessage):
         # Stop any active spinner
         tracker.stop()
 
@@ -602,7 +613,7 @@ def process_sdk_message(
     else:
         # Log unknown message types for debugging
         if tracker.verbose:
-            console.print(f"\n[dim]Unknown message type: {msg_type}[/dim]")
+            console.print(f"\n[dim]Unknown message type: {type(msg).__name__}[/dim]")
             console.print(f"[dim]Message: {msg}[/dim]")
 
 
@@ -6,6 +6,45 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+# Triagent slash commands shown by /help
+_COMMANDS: tuple[tuple[str, str], ...] = (
+    ("/init", "Run initial setup wizard"),
+    ("/help", "Show this help message"),
+    ("/config", "View current configuration"),
+    ("/config show", "Display all config values"),
+    ("/config set <key> <value>", "Set a config value"),
+    ("/team", "Show current team"),
+    ("/team <name>", "Switch team (levvia/omnia/omnia-data)"),
+    ("/persona", "Show current persona and available options"),
+    ("/persona <name>", "Switch persona (developer/support)"),
+    ("/team-report <team>", "Generate team iteration status report"),
+    ("/team-report <team> --save", "Generate and save report to docs/"),
+    ("/team-report <a>,<b> | --all", "Generate reports for several teams"),
+    ("/team-report <team> --refresh", "Re-fetch cached iteration and members"),
+    ("/confirm", "Show write confirmation status"),
+    ("/confirm on", "Enable confirmations for ADO/Git writes"),
+    ("/confirm off", "Disable confirmations (auto-approve)"),
+    ("/versions", "Show installed and pinned tool versions"),
+    ("/clear", "Clear conversation history"),
+    ("/exit, /quit", "Exit Triagent"),
+)
+
+
+def _build_help_panel() -> Panel:
+    """Build the static Triagent commands panel."""
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Command", style="green")
+    table.add_column("Description")
+
+    for cmd, desc in _COMMANDS:
+        table.add_row(cmd, desc)
+
+    return Panel(table, title="[bold cyan]Triagent Commands[/bold cyan]", border_style="cyan")
+
+
+# Static content, so build the panel once rather than on every /help
+_HELP_PANEL = _build_help_panel()
+
 
 def help_command(
     console: Console,
@@ -18,37 +57,8 @@ def help_command(
         sdk_commands: Available SDK slash commands (from get_server_info)
     """
     # Section 1: Triagent CLI Commands
-    table = Table(show_header=True, header_style="bold cyan")
-    table.add_column("Command", style="green")
-    table.add_column("Description")
-
-    commands = [
-        ("/init", "Run initial setup wizard"),
-        ("/help", "Show this help message"),
-        ("/config", "View current configuration"),
-        ("/config show", "Display all config values"),
-        ("/config set <key> <value>", "Set a config value"),
-        ("/team", "Show current team"),
-        ("/team <name>", "Switch team (levvia/omnia/omnia-data)"),
-        ("/persona", "Show current persona and available options"),
-        ("/persona <name>", "Switch persona (developer/support)"),
-        ("/team-report <team>", "Generate team iteration status report"),
-        ("/team-report <team> --save", "Generate and save report to docs/"),
-        ("/confirm", "Show write confirmation status"),
-        ("/confirm on", "Enable confirmations for ADO/Git writes"),
-        ("/confirm off", "Disable confirmations (auto-approve)"),
-        ("/versions", "Show installed and pinned tool versions"),
-        ("/clear", "Clear conversation history"),
-        ("/exit, /quit", "Exit Triagent"),
-    ]
-
-    for cmd, desc in commands:
-        table.add_row(cmd, desc)
-
     console.print()
-    console.print(
-        Panel(table, title="[bold cyan]Triagent Commands[/bold cyan]", border_style="cyan")
-    )
+    console.print(_HELP_PANEL)
 
     # Section 2: Claude Code SDK Commands
     if sdk_commands:
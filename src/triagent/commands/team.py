@@ -6,7 +6,29 @@ from rich.console import Console
 from rich.panel import Panel
 
 from triagent.config import ConfigManager
-from triagent.teams.config import TEAM_CONFIG, get_team_config
+from triagent.teams.config import TEAM_CONFIG, TeamConfig, get_team_config
+
+# Team name list shown when an unknown team is requested
+_AVAILABLE_TEAM_NAMES = "\n".join(f"  - {name}" for name in TEAM_CONFIG)
+
+# "Available teams" lines, without the current-team marker
+_AVAILABLE_TEAMS_LINES = [
+    (name, f"  - {name}: {tc.display_name}") for name, tc in TEAM_CONFIG.items()
+]
+
+# TEAM_CONFIG is static, so each team's panel only needs building once
+_TEAM_PANEL_CACHE: dict[str, Panel] = {}
+
+
+def _build_team_panel(team_config: TeamConfig) -> Panel:
+    """Build the "Current Team" panel for a team."""
+    return Panel(
+        f"[bold]Team:[/bold] {team_config.display_name}\n"
+        f"[bold]ADO Project:[/bold] {team_config.ado_project}\n"
+        f"[bold]ADO Organization:[/bold] {team_config.ado_organization}",
+        title="[bold cyan]Current Team[/bold cyan]",
+        border_style="cyan",
+    )
 
 
 def team_command(
@@ -25,43 +47,38 @@ def team_command(
 
     if team_name is None:
         # Show current team
-        team_config = get_team_config(config.team)
-        if team_config:
+        panel = _TEAM_PANEL_CACHE.get(config.team)
+        if panel is None:
+            team_config = get_team_config(config.team)
+            if team_config:
+                panel = _build_team_panel(team_config)
+                _TEAM_PANEL_CACHE[config.team] = panel
+        if panel is not None:
             console.print()
-            console.print(
-                Panel(
-                    f"[bold]Team:[/bold] {team_config.display_name}\n"
-                    f"[bold]ADO Project:[/bold] {team_config.ado_project}\n"
-                    f"[bold]ADO Organization:[/bold] {team_config.ado_organization}",
-                    title="[bold cyan]Current Team[/bold cyan]",
-                    border_style="cyan",
-                )
-            )
+            console.print(panel)
         else:
             console.print(f"[yellow]Current team '{config.team}' not found in config[/yellow]")
 
         # Show available teams
         console.print()
         console.print("[bold]Available teams:[/bold]")
-        for name, tc in TEAM_CONFIG.items():
+        for name, line in _AVAILABLE_TEAMS_LINES:
             marker = " [green](current)[/green]" if name == config.team else ""
-            console.print(f"  - {name}: {tc.display_name}{marker}")
+            console.print(f"{line}{marker}")
         console.print()
         return
 
-    # Switch team
-    team_name = team_name.lower().strip()
+    # Switch team (get_team_config normalizes case and whitespace)
     new_team = get_team_config(team_name)
 
     if new_team is None:
-        console.print(f"[red]Error:[/red] Unknown team '{team_name}'")
+        console.print(f"[red]Error:[/red] Unknown team '{team_name.strip()}'")
         console.print("[bold]Available teams:[/bold]")
-        for name in TEAM_CONFIG:
-            console.print(f"  - {name}")
+        console.print(_AVAILABLE_TEAM_NAMES)
         return
 
     # Update config
-    config.team = team_name
+    config.team = new_team.name
     config.ado_project = new_team.ado_project
     config.ado_organization = new_team.ado_organization
     config_manager.save_config(config)
@@ -2,22 +2,63 @@
 
 from __future__ import annotations
 
-import json
-import subprocess
+import asyncio
+import hashlib
+import os
+import re
+import shutil
+import time
 from collections import Counter
-from datetime import datetime
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+from urllib.parse import quote
 
+import httpx
+import orjson
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from triagent.config import ConfigManager
+try:
+    import ahocorasick
+except ImportError:  # Optional: pip install "triagent[fast]"
+    ahocorasick = None
+
+from triagent.config import CONFIG_DIR, ConfigManager
+from triagent.mcp.setup import _find_az_command
+from triagent.tools.azure_cli import az_subprocess_env
 
 # ADO Configuration
 ORG_URL = "https://dev.azure.com/symphonyvsts"
 PROJECT = "Audit Cortex 2"
+ADO_API_VERSION = "7.1"
+
+# Azure AD resource id for Azure DevOps
+ADO_RESOURCE_ID = "499b84ac-1321-427f-aa17-267ca6975798"
+
+# workitemsbatch accepts at most 200 ids per request
+WORK_ITEM_BATCH_SIZE = 200
+WORK_ITEM_FIELDS = [
+    "System.Id",
+    "System.Title",
+    "System.State",
+    "System.WorkItemType",
+    "System.AssignedTo",
+    "Microsoft.VSTS.Common.Priority",
+    "Microsoft.VSTS.Scheduling.StoryPoints",
+]
+
+# Concurrency cap and 429 retries when reporting on several teams at once
+MAX_CONCURRENT_TEAMS = 8
+MAX_RATE_LIMIT_RETRIES = 3
+
+# On-disk cache for slow-changing team metadata (TTLs in seconds)
+ADO_CACHE_DIR = CONFIG_DIR / "cache" / "ado"
+ITERATIONS_CACHE_TTL = 600
+MEMBERS_CACHE_TTL = 3600
 
 # Team area path mappings
 TEAM_AREA_PATHS = {
@@ -47,102 +88,432 @@ PODS = {
     "Data In Use": ["Giga", "Kilo", "Tera"],
 }
 
+# Team names in display order for prompts and error messages
+_SORTED_TEAMS = tuple(sorted(TEAM_AREA_PATHS))
+_TEAM_DISPLAY = tuple(name.title() for name in _SORTED_TEAMS)
+
+# Reverse POD lookup keyed by lower-cased team name
+TEAM_TO_POD = {team.lower(): pod for pod, teams in PODS.items() for team in teams}
+
+_T = TypeVar("_T")
+
+# Task title patterns for role identification
+QA_TASK_PATTERNS = ["[QA Task]", "Test Case", "Defect Testing", "UI Testing"]
+DEV_TASK_PATTERNS = ["[Dev-BE]", "[Dev-UI]", "[Dev UI]", "Implementation", "PR Creation", "Code Review"]
+
+
+def _build_title_matcher(patterns: list[str]) -> Callable[[str], object]:
+    """Build a case-insensitive matcher for any of the patterns in a title.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    a single compiled regex alternation. The result is truthy on a match.
+    """
+    if ahocorasick is None:
+        return re.compile("|".join(map(re.escape, patterns)), re.IGNORECASE).search
+
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern.lower(), pattern)
+    automaton.make_automaton()
+    iter_matches = automaton.iter
+
+    def match(title: str) -> object:
+        return next(iter_matches(title.lower()), None)
+
+    return match
+
+
+_QA_MATCH = _build_title_matcher(QA_TASK_PATTERNS)
+_DEV_MATCH = _build_title_matcher(DEV_TASK_PATTERNS)
+
+# Precomputed progress bar segments, sliced to width
+_MAX_BAR_WIDTH = 64
+_FULL_BAR = "█" * _MAX_BAR_WIDTH
+_EMPTY_BAR = "░" * _MAX_BAR_WIDTH
+
+# Current iteration per (team, day); the timeframe changes at most daily
+_iteration_memo: dict[tuple[str, date], tuple[str, str]] = {}
+
+# Cached (access_token, expires_on) for the Azure DevOps REST API
+_access_token: tuple[str, float] | None = None
+
+
+def _run_coroutine(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion from synchronous code.
+
+    Slash commands are dispatched synchronously from inside the interactive
+    event loop, where asyncio.run() is not allowed, so in that case the
+    coroutine runs on its own loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
 
-def run_az_command(command: str, console: Console | None = None) -> Any:
-    """Execute an Azure CLI command and return parsed JSON output."""
+
+async def run_az_command_async(args: list[str], console: Console | None = None) -> Any:
+    """Execute an Azure CLI command without blocking the event loop.
+
+    Args:
+        args: Command argv; run without a shell
+        console: Optional console for error output
+
+    Returns:
+        Parsed JSON output, or an empty list on failure
+    """
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=120,
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=az_subprocess_env(),
         )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            if console:
+                console.print("[yellow]Command timed out[/yellow]")
+            return []
 
-        if result.returncode == 0:
-            if result.stdout.strip():
-                return json.loads(result.stdout)
+        if proc.returncode == 0:
+            if stdout.strip():
+                return orjson.loads(stdout)
             return []
         else:
             if console:
-                console.print(f"[dim]Command failed: {result.stderr[:200]}[/dim]")
+                error = stderr[:200].decode("utf-8", "replace")
+                console.print(f"[dim]Command failed: {error}[/dim]")
             return []
-    except subprocess.TimeoutExpired:
-        if console:
-            console.print("[yellow]Command timed out[/yellow]")
-        return []
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return []
     except Exception:
         return []
 
 
-def get_current_iteration(team_name: str, console: Console) -> tuple[str, str] | None:
-    """Get the current iteration path for a team."""
-    command = (
-        f'az boards iteration team list --team "{team_name}" '
-        f'--project "{PROJECT}" --organization {ORG_URL} --output json 2>/dev/null'
+async def get_access_token(console: Console | None = None) -> str | None:
+    """Get an Azure DevOps access token from the Azure CLI login.
+
+    The token is cached in memory until shortly before it expires, so az is
+    only spawned once per session rather than once per request. Failures
+    are reported on the console.
+    """
+    global _access_token
+
+    if _access_token and _access_token[1] - 60 > time.time():
+        return _access_token[0]
+
+    # Resolve a full path: without a shell, exec cannot find az.cmd on Windows
+    az_cmd = _find_az_command()
+    az_path = shutil.which(az_cmd) if az_cmd else None
+    if az_path is None:
+        if console:
+            console.print("[red]Azure CLI (az) not found; install it and run 'az login'[/red]")
+        return None
+
+    result = await run_az_command_async(
+        [
+            az_path, "account", "get-access-token",
+            "--resource", ADO_RESOURCE_ID,
+            "--output", "json",
+            "--only-show-errors",
+        ],
+        console,
+    )
+    if not result or not result.get("accessToken"):
+        if console:
+            console.print("[dim]Could not get an Azure DevOps token; run 'az login'[/dim]")
+        return None
+
+    expires_on = result.get("expires_on") or time.time() + 300
+    _access_token = (result["accessToken"], float(expires_on))
+    return _access_token[0]
+
+
+def _create_ado_client(token: str) -> httpx.AsyncClient:
+    """Create an HTTP/2 client for the Azure DevOps REST API."""
+    return httpx.AsyncClient(
+        base_url=f"{ORG_URL}/",
+        http2=True,
+        timeout=120,
+        headers={"Authorization": f"Bearer {token}"},
+        params={"api-version": ADO_API_VERSION},
     )
-    iterations = run_az_command(command, console)
 
-    if not iterations:
+
+async def _ado_request(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    console: Console | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Send an Azure DevOps REST request and return parsed JSON output.
+
+    Rate-limited (429) responses are retried after the Retry-After delay.
+    Failed requests and non-JSON bodies yield an empty dict.
+    """
+    for attempt in range(1, MAX_RATE_LIMIT_RETRIES + 1):
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            if console:
+                console.print(f"[dim]Request failed: {e}[/dim]")
+            return {}
+
+        if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+            break
+        retry_after = response.headers.get("Retry-After", "")
+        await asyncio.sleep(float(retry_after) if retry_after.isdigit() else attempt)
+
+    if not response.is_success:
+        if console:
+            console.print(f"[dim]Request failed: {response.status_code} {response.text[:200]}[/dim]")
+        return {}
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        # e.g. a 203 HTML sign-in page or an empty 204 body
+        if console:
+            console.print(f"[dim]Unexpected response: {response.status_code} {response.text[:200]}[/dim]")
+        return {}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary sibling so readers never see a partial file."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _cache_path(key: tuple[str, ...]) -> Path:
+    """Get the cache file for a key."""
+    digest = hashlib.sha256("\0".join(key).encode()).hexdigest()
+    return ADO_CACHE_DIR / f"{digest}.json"
+
+
+def _read_cache(key: tuple[str, ...], ttl: float) -> Any:
+    """Read a cached response, or None if missing or older than ttl seconds."""
+    path = _cache_path(key)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
         return None
 
+
+def _write_cache(key: tuple[str, ...], data: Any) -> None:
+    """Write a response to the cache, ignoring filesystem errors."""
+    try:
+        ADO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _write_atomic(_cache_path(key), orjson.dumps(data))
+    except OSError:
+        pass
+
+
+async def _cached_ado_get(
+    client: httpx.AsyncClient,
+    url: str,
+    console: Console,
+    key: tuple[str, ...],
+    ttl: float,
+    refresh: bool = False,
+    **kwargs: Any,
+) -> Any:
+    """GET an Azure DevOps resource, serving it from disk while fresh.
+
+    With refresh, the cached copy is ignored and replaced.
+    """
+    cache_key = (ORG_URL, PROJECT, *key)
+    data = None if refresh else _read_cache(cache_key, ttl)
+    if data is None:
+        data = await _ado_request(client, "GET", url, console, **kwargs)
+        if data:
+            _write_cache(cache_key, data)
+    return data
+
+
+async def get_current_iteration(
+    client: httpx.AsyncClient,
+    team_name: str,
+    console: Console,
+    refresh: bool = False,
+) -> tuple[str, str] | None:
+    """Get the current iteration path for a team.
+
+    The result is remembered for the rest of the day unless refresh is set.
+    """
+    memo_key = (team_name.lower(), date.today())
+    if not refresh and memo_key in _iteration_memo:
+        return _iteration_memo[memo_key]
+
+    data = await _cached_ado_get(
+        client,
+        f"{quote(PROJECT)}/{quote(team_name)}/_apis/work/teamsettings/iterations",
+        console,
+        (team_name.lower(), "iterations"),
+        ITERATIONS_CACHE_TTL,
+        refresh,
+        params={"$timeframe": "current"},
+    )
+    iterations = data.get("value", [])
+
     for iteration in iterations:
         time_frame = iteration.get("attributes", {}).get("timeFrame", "")
         if time_frame == "current":
             path = iteration.get("path", "")
             name = iteration.get("name", "")
+            _iteration_memo[memo_key] = (path, name)
             return (path, name)
 
     return None
 
 
-def get_team_members(team_name: str, console: Console) -> list[dict[str, Any]]:
+async def get_team_members(
+    client: httpx.AsyncClient,
+    team_name: str,
+    console: Console,
+    refresh: bool = False,
+) -> list[dict[str, Any]]:
     """Get team member list with admin status."""
-    command = (
-        f'az devops team list-member --team "{team_name}" '
-        f'--project "{PROJECT}" --organization {ORG_URL} --output json 2>/dev/null'
+    data = await _cached_ado_get(
+        client,
+        f"_apis/projects/{quote(PROJECT)}/teams/{quote(team_name)}/members",
+        console,
+        (team_name.lower(), "members"),
+        MEMBERS_CACHE_TTL,
+        refresh,
     )
-    members = run_az_command(command, console)
-    return members if members else []
+    return data.get("value", [])
 
 
-def query_work_items(
+async def query_work_items(
+    client: httpx.AsyncClient,
     iteration_path: str,
     area_path: str,
     console: Console,
 ) -> list[dict[str, Any]]:
     """Query all work items for an iteration and area path."""
-    # Escape backslashes for WIQL
-    escaped_area = area_path.replace("\\", "\\\\")
-    escaped_iter = iteration_path.replace("\\", "\\\\")
-
+    # Only ids are selected; the report fields come from workitemsbatch
     wiql = (
-        f"SELECT [System.Id], [System.Title], [System.State], "
-        f"[System.WorkItemType], [System.AssignedTo], "
-        f"[Microsoft.VSTS.Common.Priority], [Microsoft.VSTS.Scheduling.StoryPoints] "
+        f"SELECT [System.Id] "
         f"FROM WorkItems "
-        f"WHERE [System.IterationPath] = '{escaped_iter}' "
-        f"AND [System.AreaPath] UNDER '{escaped_area}' "
+        f"WHERE [System.IterationPath] = '{iteration_path}' "
+        f"AND [System.AreaPath] UNDER '{area_path}' "
         f"ORDER BY [System.WorkItemType], [System.State]"
     )
 
-    command = (
-        f'az boards query --wiql "{wiql}" '
-        f'--project "{PROJECT}" --organization {ORG_URL} --output json 2>/dev/null'
+    data = await _ado_request(
+        client, "POST", f"{quote(PROJECT)}/_apis/wit/wiql", console, json={"query": wiql}
+    )
+    ids = [item["id"] for item in data.get("workItems", [])]
+
+    # Batches are fetched concurrently; gather keeps them in WIQL order
+    batches = await asyncio.gather(
+        *(
+            _ado_request(
+                client,
+                "POST",
+                f"{quote(PROJECT)}/_apis/wit/workitemsbatch",
+                console,
+                content=orjson.dumps(
+                    {"ids": ids[start : start + WORK_ITEM_BATCH_SIZE], "fields": WORK_ITEM_FIELDS}
+                ),
+                headers={"Content-Type": "application/json"},
+            )
+            for start in range(0, len(ids), WORK_ITEM_BATCH_SIZE)
+        )
     )
-    work_items = run_az_command(command, console)
-    return work_items if work_items else []
+    return [item for batch in batches for item in batch.get("value", [])]
+
+
+async def fetch_team_data(
+    team_name: str,
+    area_path: str,
+    console: Console,
+    refresh: bool = False,
+) -> tuple[tuple[str, str] | None, list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch iteration, members and work items for a team.
+
+    All requests share one pooled HTTP/2 connection. The iteration and member
+    lookups run concurrently; the work item query waits for the iteration path.
+    With refresh, cached iteration and member data is re-fetched.
+
+    Returns:
+        Tuple of (iteration_info, members, raw_work_items); iteration_info is
+        None (and work items empty) when no current iteration was found
+    """
+    token = await get_access_token(console)
+    if not token:
+        return None, [], []
+
+    async with _create_ado_client(token) as client:
+        return await _fetch_team_data(client, team_name, area_path, console, refresh)
+
+
+async def fetch_teams_data(
+    team_names: list[str],
+    console: Console,
+    refresh: bool = False,
+) -> list[tuple[tuple[str, str] | None, list[dict[str, Any]], list[dict[str, Any]]]]:
+    """Fetch report data for several teams concurrently.
+
+    Teams share one client and at most MAX_CONCURRENT_TEAMS are fetched at a
+    time to stay within Azure DevOps rate limits.
+
+    Args:
+        team_names: Team names (keys of TEAM_AREA_PATHS, any case)
+        console: Rich console for output
+        refresh: Re-fetch cached iteration and member data
+
+    Returns:
+        fetch_team_data results, in the same order as team_names
+    """
+    token = await get_access_token(console)
+    if not token:
+        return [(None, [], []) for _ in team_names]
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TEAMS)
+
+    async with _create_ado_client(token) as client:
+
+        async def fetch_one(team_name: str) -> Any:
+            async with semaphore:
+                return await _fetch_team_data(
+                    client, team_name, TEAM_AREA_PATHS[team_name.lower()], console, refresh
+                )
+
+        return list(await asyncio.gather(*(fetch_one(name) for name in team_names)))
+
+
+async def _fetch_team_data(
+    client: httpx.AsyncClient,
+    team_name: str,
+    area_path: str,
+    console: Console,
+    refresh: bool = False,
+) -> tuple[tuple[str, str] | None, list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch iteration, members and work items for a team over a given client."""
+    iteration_info, members = await asyncio.gather(
+        get_current_iteration(client, team_name, console, refresh),
+        get_team_members(client, team_name, console, refresh),
+    )
+    if not iteration_info:
+        return None, members, []
+
+    iteration_path, _ = iteration_info
+    raw_work_items = await query_work_items(client, iteration_path, area_path, console)
+    return iteration_info, members, raw_work_items
 
 
 def get_pod_for_team(team_name: str) -> str:
     """Get the POD name for a team."""
-    title_team = team_name.title()
-    for pod_name, teams in PODS.items():
-        if title_team in teams:
-            return pod_name
-    return "Unknown"
+    return TEAM_TO_POD.get(team_name.lower(), "Unknown")
 
 
 def categorize_work_items(work_items: list[dict[str, Any]]) -> dict[str, list[dict]]:
@@ -175,19 +546,52 @@ def categorize_work_items(work_items: list[dict[str, Any]]) -> dict[str, list[di
     return categories
 
 
-def count_by_state(items: list[dict]) -> dict[str, int]:
-    """Count items by state."""
-    return dict(Counter(item["state"] for item in items))
+def summarize_work_items(
+    items: list[dict],
+) -> tuple[Counter[str], int, list[dict], list[dict], list[dict]]:
+    """Summarize work items in a single pass.
+
+    Args:
+        items: Parsed work items of one type
+
+    Returns:
+        Tuple of (state counts, done count, active items, blocked items,
+        unassigned P1 items)
+    """
+    states: Counter[str] = Counter()
+    done = 0
+    active: list[dict] = []
+    blocked: list[dict] = []
+    unassigned_p1: list[dict] = []
+
+    for item in items:
+        state = item["state"]
+        states[state] += 1
+        if state == "Done" or state == "Closed":
+            done += 1
+        else:
+            active.append(item)
+        if "blocked" in state.lower():
+            blocked.append(item)
+        if item["assigned_to"] == "Unassigned" and item.get("priority", 99) == 1:
+            unassigned_p1.append(item)
+
+    return states, done, active, blocked, unassigned_p1
 
 
 def generate_progress_bar(done: int, total: int, width: int = 20) -> str:
     """Generate an ASCII progress bar."""
+    full_bar = _FULL_BAR
+    empty_bar = _EMPTY_BAR
+    if width > _MAX_BAR_WIDTH:
+        full_bar = "█" * width
+        empty_bar = "░" * width
+
     if total == 0:
-        return "░" * width + " 0%"
-    percentage = (done / total) * 100
-    filled = int((done / total) * width)
-    bar = "█" * filled + "░" * (width - filled)
-    return f"{bar} {percentage:.0f}%"
+        return f"{empty_bar[:width]} 0%"
+    ratio = done / total
+    filled = int(ratio * width)
+    return f"{full_bar[:filled]}{empty_bar[:width - filled]} {ratio * 100:.0f}%"
 
 
 def identify_roles(
@@ -202,22 +606,23 @@ def identify_roles(
         "other": [],
     }
 
-    # Task patterns for role identification
-    qa_patterns = ["[QA Task]", "Test Case", "Defect Testing", "UI Testing"]
-    dev_patterns = ["[Dev-BE]", "[Dev-UI]", "[Dev UI]", "Implementation", "PR Creation", "Code Review"]
-
     # Get all unique assignees from tasks
     assignees_with_dev_tasks: set[str] = set()
     assignees_with_qa_tasks: set[str] = set()
 
-    for task in tasks:
-        title = task.get("title", "")
-        assignee = task.get("assigned_to", "")
+    # Bound to locals for the loop; tasks come from categorize_work_items,
+    # which always sets title and assigned_to
+    dev_search = _DEV_MATCH
+    qa_search = _QA_MATCH
+    add_dev = assignees_with_dev_tasks.add
+    add_qa = assignees_with_qa_tasks.add
 
-        if any(p.lower() in title.lower() for p in dev_patterns):
-            assignees_with_dev_tasks.add(assignee)
-        if any(p.lower() in title.lower() for p in qa_patterns):
-            assignees_with_qa_tasks.add(assignee)
+    for task in tasks:
+        title = task["title"]
+        if dev_search(title):
+            add_dev(task["assigned_to"])
+        if qa_search(title):
+            add_qa(task["assigned_to"])
 
     # Categorize members
     for member in members:
@@ -240,6 +645,20 @@ def identify_roles(
     return roles
 
 
+def _escape_table_cell(text: str) -> str:
+    """Escape characters that would break a markdown table row.
+
+    Args:
+        text: Work item field value from Azure DevOps
+
+    Returns:
+        Text safe to place inside a table cell
+    """
+    if "|" in text or "\n" in text:
+        return text.replace("|", "\\|").replace("\n", " ")
+    return text
+
+
 def generate_report_markdown(
     team_name: str,
     iteration_path: str,
@@ -252,22 +671,22 @@ def generate_report_markdown(
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
     pod_name = get_pod_for_team(team_name)
 
-    # Count work items by state
-    task_states = count_by_state(work_items["Task"])
-    bug_states = count_by_state(work_items["Bug"])
-    pbi_states = count_by_state(work_items["Product Backlog Item"])
+    # One pass per work item type for counts, active, blocked and unassigned P1
+    summaries = {wi_type: summarize_work_items(items) for wi_type, items in work_items.items()}
+    task_states, done_tasks, _, _, _ = summaries["Task"]
+    bug_states, done_bugs, active_bugs, _, unassigned_p1_bugs = summaries["Bug"]
+    pbi_states, done_pbis, _, _, _ = summaries["Product Backlog Item"]
 
-    # Calculate totals
     total_tasks = len(work_items["Task"])
-    done_tasks = task_states.get("Done", 0) + task_states.get("Closed", 0)
-
     total_bugs = len(work_items["Bug"])
-    done_bugs = bug_states.get("Done", 0) + bug_states.get("Closed", 0)
-
     total_pbis = len(work_items["Product Backlog Item"])
-    done_pbis = pbi_states.get("Done", 0) + pbi_states.get("Closed", 0)
+    total_items = total_tasks + total_bugs + total_pbis
 
-    report = f"""# {team_name.title()} Team - {iteration_name} Status Report
+    pct_tasks = done_tasks * 100 / total_tasks if total_tasks else 0.0
+    pct_bugs = done_bugs * 100 / total_bugs if total_bugs else 0.0
+    pct_pbis = done_pbis * 100 / total_pbis if total_pbis else 0.0
+
+    parts = [f"""# {team_name.title()} Team - {iteration_name} Status Report
 
 **Team:** {team_name.title()}
 **POD:** {pod_name}
@@ -281,39 +700,39 @@ def generate_report_markdown(
 
 | Metric | Count |
 |--------|-------|
-| Total Work Items | {total_tasks + total_bugs + total_pbis} |
-| Tasks Completed | {done_tasks} / {total_tasks} ({(done_tasks/total_tasks*100 if total_tasks else 0):.0f}%) |
-| Bugs Resolved | {done_bugs} / {total_bugs} ({(done_bugs/total_bugs*100 if total_bugs else 0):.0f}%) |
-| PBIs Done | {done_pbis} / {total_pbis} ({(done_pbis/total_pbis*100 if total_pbis else 0):.0f}%) |
+| Total Work Items | {total_items} |
+| Tasks Completed | {done_tasks} / {total_tasks} ({pct_tasks:.0f}%) |
+| Bugs Resolved | {done_bugs} / {total_bugs} ({pct_bugs:.0f}%) |
+| PBIs Done | {done_pbis} / {total_pbis} ({pct_pbis:.0f}%) |
 
 ---
 
 ## Team Structure ({len(members)} Members)
 
 ### Team Admins
-"""
+"""]
 
     for admin in roles["admins"]:
-        report += f"- {admin['name']} ({admin['email']})\n"
+        parts.append(f"- {admin['name']} ({admin['email']})\n")
 
     if not roles["admins"]:
-        report += "- No admins identified\n"
+        parts.append("- No admins identified\n")
 
-    report += "\n### Developers\n"
+    parts.append("\n### Developers\n")
     for dev in roles["developers"]:
-        report += f"- {dev['name']}\n"
+        parts.append(f"- {dev['name']}\n")
 
     if not roles["developers"]:
-        report += "- No developers identified from task assignments\n"
+        parts.append("- No developers identified from task assignments\n")
 
-    report += "\n### QA Engineers\n"
+    parts.append("\n### QA Engineers\n")
     for qa in roles["qa"]:
-        report += f"- {qa['name']}\n"
+        parts.append(f"- {qa['name']}\n")
 
     if not roles["qa"]:
-        report += "- No QA engineers identified from task assignments\n"
+        parts.append("- No QA engineers identified from task assignments\n")
 
-    report += f"""
+    parts.append(f"""
 ---
 
 ## Work Item Summary
@@ -322,45 +741,46 @@ def generate_report_markdown(
 
 | State | Count | Percentage |
 |-------|-------|------------|
-"""
+""")
     for state, count in sorted(task_states.items()):
         pct = count / total_tasks * 100 if total_tasks else 0
-        report += f"| {state} | {count} | {pct:.0f}% |\n"
+        parts.append(f"| {state} | {count} | {pct:.0f}% |\n")
 
-    report += f"""
+    parts.append(f"""
 ### Bugs ({total_bugs} Total)
 
 | State | Count |
 |-------|-------|
-"""
+""")
     for state, count in sorted(bug_states.items()):
-        report += f"| {state} | {count} |\n"
+        parts.append(f"| {state} | {count} |\n")
 
-    report += f"""
+    parts.append(f"""
 ### Product Backlog Items ({total_pbis} Total)
 
 | State | Count |
 |-------|-------|
-"""
+""")
     for state, count in sorted(pbi_states.items()):
-        report += f"| {state} | {count} |\n"
+        parts.append(f"| {state} | {count} |\n")
 
     # Active bugs section
-    active_bugs = [b for b in work_items["Bug"] if b["state"] not in ["Done", "Closed"]]
     if active_bugs:
-        report += """
+        parts.append("""
 ---
 
 ## Active Bugs (Not Closed)
 
 | ID | Title | Assignee | Priority |
 |----|-------|----------|----------|
-"""
+""")
         for bug in sorted(active_bugs, key=lambda x: x.get("priority", 99)):
-            report += f"| {bug['id']} | {bug['title'][:50]}... | {bug['assigned_to']} | P{bug['priority']} |\n"
+            title = _escape_table_cell(bug["title"][:50])
+            assignee = _escape_table_cell(bug["assigned_to"])
+            parts.append(f"| {bug['id']} | {title}... | {assignee} | P{bug['priority']} |\n")
 
     # Progress visualization
-    report += f"""
+    parts.append(f"""
 ---
 
 ## Progress Visualization
@@ -375,39 +795,32 @@ PBIs:     {generate_progress_bar(done_pbis, total_pbis)} ({done_pbis}/{total_pbi
 
 ## Risks & Blockers
 
-"""
+""")
 
     # Find blocked items
-    blocked_items = []
-    for wi_type, items in work_items.items():
-        for item in items:
-            if "blocked" in item["state"].lower():
-                blocked_items.append((wi_type, item))
-
+    blocked_items = [
+        (wi_type, item) for wi_type, summary in summaries.items() for item in summary[3]
+    ]
     if blocked_items:
-        report += "### Blocked Items\n"
+        parts.append("### Blocked Items\n")
         for wi_type, item in blocked_items:
-            report += f"- [{wi_type}] #{item['id']}: {item['title'][:60]}... (Assigned: {item['assigned_to']})\n"
+            parts.append(f"- [{wi_type}] #{item['id']}: {item['title'][:60]}... (Assigned: {item['assigned_to']})\n")
     else:
-        report += "- No blocked items\n"
+        parts.append("- No blocked items\n")
 
     # High priority unassigned bugs
-    unassigned_p1_bugs = [
-        b for b in work_items["Bug"]
-        if b["assigned_to"] == "Unassigned" and b.get("priority", 99) == 1
-    ]
     if unassigned_p1_bugs:
-        report += "\n### Unassigned P1 Bugs\n"
+        parts.append("\n### Unassigned P1 Bugs\n")
         for bug in unassigned_p1_bugs:
-            report += f"- #{bug['id']}: {bug['title'][:60]}...\n"
+            parts.append(f"- #{bug['id']}: {bug['title'][:60]}...\n")
 
-    report += """
+    parts.append("""
 ---
 
 *Report generated by Triagent | Azure DevOps Automation*
-"""
+""")
 
-    return report
+    return "".join(parts)
 
 
 def save_report_to_file(report: str, team_name: str, console: Console) -> None:
@@ -422,7 +835,7 @@ def save_report_to_file(report: str, team_name: str, console: Console) -> None:
     filepath = reports_dir / filename
 
     # Write file
-    filepath.write_text(report)
+    _write_atomic(filepath, report.encode("utf-8"))
 
     console.print()
     console.print(
@@ -433,6 +846,39 @@ def save_report_to_file(report: str, team_name: str, console: Console) -> None:
     )
 
 
+def build_team_report(
+    team_name: str,
+    iteration_info: tuple[str, str],
+    members: list[dict[str, Any]],
+    raw_work_items: list[dict[str, Any]],
+) -> str:
+    """Build the markdown report from fetched team data."""
+    iteration_path, iteration_name = iteration_info
+
+    # Process work items
+    work_items = categorize_work_items(raw_work_items)
+
+    # Identify roles
+    roles = identify_roles(members, work_items["Task"])
+
+    # Generate report
+    return generate_report_markdown(
+        team_name,
+        iteration_path,
+        iteration_name,
+        members,
+        work_items,
+        roles,
+    )
+
+
+def _print_available_teams(console: Console) -> None:
+    """Print the list of known team names."""
+    console.print("[bold]Available teams:[/bold]")
+    for name in _TEAM_DISPLAY:
+        console.print(f"  - {name}")
+
+
 def team_report_command(
     console: Console,
     config_manager: ConfigManager,
@@ -443,16 +889,23 @@ def team_report_command(
     Args:
         console: Rich console for output
         config_manager: Config manager instance
-        args: Command arguments (team name, --save flag)
+        args: Command arguments (team name, comma-separated team names or
+            --all, --save and --refresh flags)
     """
     # Parse arguments
     team_name: str | None = None
     save_to_file = False
+    all_teams = False
+    refresh = False
 
     if args:
         for arg in args:
             if arg == "--save":
                 save_to_file = True
+            elif arg == "--all":
+                all_teams = True
+            elif arg == "--refresh":
+                refresh = True
             elif not arg.startswith("-"):
                 if team_name is None:
                     team_name = arg
@@ -460,26 +913,24 @@ def team_report_command(
                     team_name = f"{team_name} {arg}"  # Handle multi-word team names
 
     # Prompt for team if not provided
-    if not team_name:
+    if not team_name and not all_teams:
         console.print()
-        console.print("[bold]Available teams:[/bold]")
-        for name in sorted(TEAM_AREA_PATHS.keys()):
-            console.print(f"  - {name.title()}")
+        _print_available_teams(console)
         console.print()
         team_name = console.input("[cyan]Enter team name: [/cyan]").strip()
 
-    team_key = team_name.lower()
+    if all_teams:
+        team_names = list(_SORTED_TEAMS)
+    else:
+        team_names = [name.strip() for name in (team_name or "").split(",") if name.strip()]
 
-    # Validate team
-    if team_key not in TEAM_AREA_PATHS:
-        console.print(f"[red]Error: Unknown team '{team_name}'[/red]")
-        console.print("[bold]Available teams:[/bold]")
-        for name in sorted(TEAM_AREA_PATHS.keys()):
-            console.print(f"  - {name.title()}")
+    # Validate teams
+    unknown = [name for name in team_names if name.lower() not in TEAM_AREA_PATHS]
+    if unknown or not team_names:
+        console.print(f"[red]Error: Unknown team '{', '.join(unknown) or team_name}'[/red]")
+        _print_available_teams(console)
         return
 
-    area_path = TEAM_AREA_PATHS[team_key]
-
     # Fetch data with progress indicator
     with Progress(
         SpinnerColumn(),
@@ -487,45 +938,34 @@ def team_report_command(
         console=console,
         transient=True,
     ) as progress:
-        # Get current iteration
-        progress.add_task("Fetching current iteration...", total=None)
-        iteration_info = get_current_iteration(team_name, console)
+        if len(team_names) == 1:
+            # Iteration and members are fetched concurrently, then work items
+            progress.add_task("Fetching current iteration...", total=None)
+            progress.add_task("Fetching team members...", total=None)
+            progress.add_task("Querying work items...", total=None)
+            results = [
+                _run_coroutine(
+                    fetch_team_data(
+                        team_names[0], TEAM_AREA_PATHS[team_names[0].lower()], console, refresh
+                    )
+                )
+            ]
+        else:
+            progress.add_task(f"Fetching data for {len(team_names)} teams...", total=None)
+            results = _run_coroutine(fetch_teams_data(team_names, console, refresh))
 
+    for name, (iteration_info, members, raw_work_items) in zip(team_names, results, strict=True):
         if not iteration_info:
-            console.print(f"[red]Error: Could not find current iteration for team '{team_name}'[/red]")
-            return
-
-        iteration_path, iteration_name = iteration_info
+            console.print(f"[red]Error: Could not find current iteration for team '{name}'[/red]")
+            continue
 
-        # Get team members
-        progress.add_task("Fetching team members...", total=None)
-        members = get_team_members(team_name, console)
+        report = build_team_report(name, iteration_info, members, raw_work_items)
 
-        # Query work items
-        progress.add_task("Querying work items...", total=None)
-        raw_work_items = query_work_items(iteration_path, area_path, console)
-
-    # Process work items
-    work_items = categorize_work_items(raw_work_items)
-
-    # Identify roles
-    roles = identify_roles(members, work_items["Task"])
-
-    # Generate report
-    report = generate_report_markdown(
-        team_name,
-        iteration_path,
-        iteration_name,
-        members,
-        work_items,
-        roles,
-    )
-
-    # Display report
-    console.print()
-    from rich.markdown import Markdown
-    console.print(Markdown(report))
+        # Display report
+        console.print()
+        from rich.markdown import Markdown
+        console.print(Markdown(report))
 
-    # Save to file if requested
-    if save_to_file:
-        save_report_to_file(report, team_name, console)
+        # Save to file if requested
+        if save_to_file:
+            save_report_to_file(report, name, console)
@@ -16,6 +16,14 @@ MCP_SERVERS_FILE = CONFIG_DIR / "mcp_servers.json"
 HISTORY_DIR = CONFIG_DIR / "history"
 
 
+def _mtime_ns(path: Path) -> int | None:
+    """Return a file's modification time in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 @dataclass
 class TriagentConfig:
     """Triagent configuration settings."""
@@ -134,6 +142,9 @@ class ConfigManager:
 
         self._config: TriagentConfig | None = None
         self._credentials: TriagentCredentials | None = None
+        # File mtimes the cached objects were loaded from (None = no file)
+        self._config_mtime_ns: int | None = None
+        self._credentials_mtime_ns: int | None = None
 
     def ensure_dirs(self) -> None:
         """Ensure all config directories exist."""
@@ -148,18 +159,23 @@ class ConfigManager:
         return self.config_file.exists()
 
     def load_config(self) -> TriagentConfig:
-        """Load configuration from file."""
-        if self._config is not None:
-            return self._config
+        """Load configuration from file.
 
-        if not self.config_file.exists():
-            self._config = TriagentConfig()
+        The parsed config is cached and only re-read when the file's mtime
+        changes, so repeated calls cost a single stat.
+        """
+        mtime = _mtime_ns(self.config_file)
+        if self._config is not None and mtime == self._config_mtime_ns:
             return self._config
 
-        with open(self.config_file) as f:
-            data = json.load(f)
-            self._config = TriagentConfig.from_dict(data)
+        if mtime is None:
+            self._config = TriagentConfig()
+        else:
+            with open(self.config_file) as f:
+                data = json.load(f)
+                self._config = TriagentConfig.from_dict(data)
 
+        self._config_mtime_ns = mtime
         return self._config
 
     def save_config(self, config: TriagentConfig | None = None) -> None:
@@ -173,20 +189,22 @@ class ConfigManager:
         self.ensure_dirs()
         with open(self.config_file, "w") as f:
             json.dump(self._config.to_dict(), f, indent=2)
+        self._config_mtime_ns = _mtime_ns(self.config_file)
 
     def load_credentials(self) -> TriagentCredentials:
-        """Load credentials from file."""
-        if self._credentials is not None:
+        """Load credentials from file (cached until the file's mtime changes)."""
+        mtime = _mtime_ns(self.credentials_file)
+        if self._credentials is not None and mtime == self._credentials_mtime_ns:
             return self._credentials
 
-        if not self.credentials_file.exists():
+        if mtime is None:
             self._credentials = TriagentCredentials()
-            return self._credentials
-
-        with open(self.credentials_file) as f:
-            data = json.load(f)
-            self._credentials = TriagentCredentials.from_dict(data)
+        else:
+            with open(self.credentials_file) as f:
+                data = json.load(f)
+                self._credentials = TriagentCredentials.from_dict(data)
 
+        self._credentials_mtime_ns = mtime
         return self._credentials
 
     def save_credentials(self, credentials: TriagentCredentials | None = None) -> None:
@@ -204,6 +222,7 @@ class ConfigManager:
 
         # Set file permissions to owner-only
         os.chmod(self.credentials_file, 0o600)
+        self._credentials_mtime_ns = _mtime_ns(self.credentials_file)
 
     def get_config_value(self, key: str) -> Any:
         """Get a specific config value."""
@@ -6,9 +6,12 @@ import json
 import platform
 import shutil
 import subprocess
+import time
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from triagent.config import ConfigManager
 
 # Required Azure CLI extensions for full functionality
@@ -18,6 +21,12 @@ REQUIRED_AZURE_EXTENSIONS = [
     "log-analytics",       # Log Analytics queries
 ]
 
+# How long `az account show` results are reused (seconds)
+AZURE_ACCOUNT_CACHE_TTL = 5.0
+
+# (monotonic timestamp, account) from the last `az account show`
+_azure_account_cache: tuple[float, dict[str, Any] | None] | None = None
+
 MCP_SERVERS_CONFIG = {
     "azure-devops": {
         "command": "npx",
@@ -352,6 +361,9 @@ def run_azure_login() -> bool:
     Returns:
         True if login succeeded
     """
+    # The signed-in account is about to change
+    clear_azure_account_cache()
+
     az_cmd = _find_az_command()
     if not az_cmd:
         return False
@@ -382,9 +394,35 @@ def run_azure_login() -> bool:
     return False
 
 
+def clear_azure_account_cache() -> None:
+    """Forget the cached `az account show` result."""
+    global _azure_account_cache
+    _azure_account_cache = None
+
+
 def get_azure_account() -> dict[str, Any] | None:
     """Get current Azure account info.
 
+    Results are reused for AZURE_ACCOUNT_CACHE_TTL seconds so repeated
+    status checks don't each spawn az.
+
+    Returns:
+        Account info dict or None if not logged in
+    """
+    global _azure_account_cache
+
+    now = time.monotonic()
+    if _azure_account_cache and now - _azure_account_cache[0] < AZURE_ACCOUNT_CACHE_TTL:
+        return _azure_account_cache[1]
+
+    account = _fetch_azure_account()
+    _azure_account_cache = (now, account)
+    return account
+
+
+def _fetch_azure_account() -> dict[str, Any] | None:
+    """Run `az account show` and parse its output.
+
     Returns:
         Account info dict or None if not logged in
     """
@@ -392,16 +430,16 @@ def get_azure_account() -> dict[str, Any] | None:
     if not az_cmd:
         return None
 
+    # Output is kept as bytes and parsed directly by orjson
     try:
         result = subprocess.run(
             [az_cmd, "account", "show", "--output", "json"],
             capture_output=True,
-            text=True,
             timeout=10,
         )
         if result.returncode == 0:
-            return json.loads(result.stdout)
-    except (FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError):
+            return orjson.loads(result.stdout)
+    except (FileNotFoundError, subprocess.TimeoutExpired, orjson.JSONDecodeError):
         pass
 
     # Git Bash fallback: try with shell=True
@@ -411,12 +449,11 @@ def get_azure_account() -> dict[str, Any] | None:
                 f"{az_cmd} account show --output json",
                 shell=True,
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
             if result.returncode == 0:
-                return json.loads(result.stdout)
-        except (subprocess.TimeoutExpired, json.JSONDecodeError):
+                return orjson.loads(result.stdout)
+        except (subprocess.TimeoutExpired, orjson.JSONDecodeError):
             pass
 
     return None
@@ -216,7 +216,7 @@ class TriagentSDKClient:
         credentials = self.config_manager.load_credentials()
 
         # Start with Foundry auth environment
-        env = get_foundry_env(self.config_manager)
+        env = get_foundry_env(credentials)
 
         # On Windows, set CLAUDE_CODE_GIT_BASH_PATH for Claude Code CLI
         if is_windows():
@@ -52,17 +52,21 @@ TEAM_CONFIG: dict[str, TeamConfig] = {
     ),
 }
 
+# Canonical (lowercase) name -> config, built once for O(1) lookups
+_TEAM_BY_ALIAS: dict[str, TeamConfig] = {k.lower(): v for k, v in TEAM_CONFIG.items()}
+
 
 def get_team_config(team_name: str) -> TeamConfig | None:
     """Get team configuration by name.
 
     Args:
-        team_name: Team identifier (levvia, omnia, omnia-data)
+        team_name: Team identifier (levvia, omnia, omnia-data); case and
+            surrounding whitespace are ignored
 
     Returns:
         TeamConfig if found, None otherwise
     """
-    return TEAM_CONFIG.get(team_name.lower())
+    return _TEAM_BY_ALIAS.get(team_name.lower().strip())
 
 
 def get_team_names() -> list[str]:
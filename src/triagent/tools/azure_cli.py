@@ -10,6 +10,8 @@ Supports both:
 
 from __future__ import annotations
 
+import asyncio
+import os
 import shlex
 import subprocess
 from collections.abc import Callable
@@ -17,6 +19,8 @@ from typing import Any
 
 from claude_agent_sdk import tool
 
+from triagent.config import CONFIG_DIR
+
 # Tool definition for OpenAI/Anthropic function calling format (legacy)
 AZURE_CLI_TOOL = {
     "name": "execute_azure_cli",
@@ -105,6 +109,25 @@ NOTE: Date filtering is not directly available in CLI. To find recent activity:
     },
 }
 
+# Turn off az telemetry, survey prompts and warnings for non-interactive runs
+AZ_ENV_OVERRIDES = {
+    "AZURE_CORE_COLLECT_TELEMETRY": "no",
+    "AZURE_CORE_SURVEY_MESSAGE": "no",
+    "AZURE_CORE_OUTPUT": "json",
+    "AZURE_CORE_ONLY_SHOW_ERRORS": "true",
+    "AZURE_DEVOPS_CACHE_DIR": str(CONFIG_DIR / "cache" / "azure-devops"),
+}
+
+
+def az_subprocess_env() -> dict[str, str]:
+    """Get the environment for spawning az non-interactively.
+
+    Returns:
+        Copy of the current environment with AZ_ENV_OVERRIDES applied
+    """
+    return {**os.environ, **AZ_ENV_OVERRIDES}
+
+
 # Commands that require user confirmation before execution
 WRITE_OPERATIONS = ["create", "update", "delete", "run", "set-vote"]
 
@@ -160,6 +183,7 @@ def execute_azure_cli(
             capture_output=True,
             text=True,
             timeout=timeout,
+            env=az_subprocess_env(),
         )
 
         if result.returncode == 0:
@@ -221,26 +245,32 @@ async def execute_azure_cli_sdk(args: dict[str, Any]) -> dict[str, Any]:
         }
 
     try:
-        # Parse and execute the command
+        # Parse and execute the command without blocking the event loop
         cmd_args = shlex.split(command)
-        result = subprocess.run(
-            cmd_args,
-            capture_output=True,
-            text=True,
-            timeout=60,
+        proc = await asyncio.create_subprocess_exec(
+            *cmd_args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=az_subprocess_env(),
         )
-
-        if result.returncode == 0:
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+        if proc.returncode == 0:
             return {
-                "content": [{"type": "text", "text": result.stdout}],
+                "content": [{"type": "text", "text": stdout.decode("utf-8", "replace")}],
             }
         else:
             return {
-                "content": [{"type": "text", "text": f"Error: {result.stderr}"}],
+                "content": [{"type": "text", "text": f"Error: {stderr.decode('utf-8', 'replace')}"}],
                 "is_error": True,
             }
 
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         return {
             "content": [{"type": "text", "text": "Error: Command timed out after 60 seconds"}],
             "is_error": True,
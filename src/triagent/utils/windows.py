@@ -9,10 +9,11 @@ the Claude Agent SDK.
 
 import logging
 import os
-import platform
 import shutil
 import subprocess
+import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -29,6 +30,16 @@ _CMD_LENGTH_LIMIT = 8000
 # Track if we've already applied the patch
 _sdk_patched = False
 
+# Platform is fixed for the process lifetime
+_IS_WINDOWS = sys.platform == "win32"
+
+# Common Git for Windows install locations for bash.exe
+_COMMON_BASH_PATHS = (
+    r"C:\Program Files\Git\bin\bash.exe",
+    r"C:\Program Files (x86)\Git\bin\bash.exe",
+    str(Path.home() / "AppData" / "Local" / "Programs" / "Git" / "bin" / "bash.exe"),
+)
+
 
 def is_windows() -> bool:
     """Check if running on Windows.
@@ -36,9 +47,10 @@ def is_windows() -> bool:
     Returns:
         True if the current platform is Windows, False otherwise.
     """
-    return platform.system() == "Windows"
+    return _IS_WINDOWS
 
 
+@lru_cache(maxsize=1)
 def find_git_bash() -> str | None:
     """Find git bash.exe on Windows.
 
@@ -48,9 +60,15 @@ def find_git_bash() -> str | None:
     3. Common Git for Windows installation paths
     4. bash in PATH directly
 
+    The result is cached for the process; call find_git_bash.cache_clear()
+    after changing CLAUDE_CODE_GIT_BASH_PATH or PATH (e.g. in tests).
+
     Returns:
-        Path to bash.exe if found, None otherwise.
+        Path to bash.exe if found, None otherwise (always None off Windows).
     """
+    if not _IS_WINDOWS:
+        return None
+
     # Check user override first
     if env_path := os.environ.get("CLAUDE_CODE_GIT_BASH_PATH"):
         if Path(env_path).exists():
@@ -66,15 +84,9 @@ def find_git_bash() -> str | None:
             return str(bash_candidate)
 
     # Fallback: Common Git for Windows locations
-    common_paths = [
-        r"C:\Program Files\Git\bin\bash.exe",
-        r"C:\Program Files (x86)\Git\bin\bash.exe",
-        Path.home() / "AppData" / "Local" / "Programs" / "Git" / "bin" / "bash.exe",
-    ]
-
-    for path in common_paths:
-        if Path(path).exists():
-            return str(path)
+    for path in _COMMON_BASH_PATHS:
+        if os.path.isfile(path):
+            return path
 
     # Try PATH directly
     if bash_path := shutil.which("bash"):
@@ -95,15 +107,24 @@ def get_git_bash_env() -> dict[str, str]:
     return {}
 
 
+@lru_cache(maxsize=1)
 def check_winget_available() -> bool:
     """Check if winget is available on Windows.
 
+    The result is cached for the process; winget availability doesn't change
+    while triagent runs.
+
     Returns:
         True if winget is available and working, False otherwise.
     """
+    # Cheap PATH scan first; only spawn winget to confirm it works
+    winget_path = shutil.which("winget")
+    if winget_path is None:
+        return False
+
     try:
         result = subprocess.run(
-            ["winget", "--version"],
+            [winget_path, "--version"],
             capture_output=True,
             text=True,
             timeout=10,
@@ -143,7 +164,11 @@ def install_git_windows() -> bool:
             text=True,
             timeout=300,  # 5 minute timeout
         )
-        return result.returncode == 0
+        if result.returncode == 0:
+            # A fresh install changes where bash.exe can be found
+            find_git_bash.cache_clear()
+            return True
+        return False
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
@@ -0,0 +1,237 @@
+"""Tests for the Azure Foundry client."""
+
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import orjson
+import pytest
+
+from triagent import agent
+from triagent.agent import AzureFoundryClient
+from triagent.config import TriagentCredentials
+
+RESPONSE = {
+    "id": "msg_1",
+    "content": [
+        {"type": "text", "text": "Hello "},
+        {"type": "tool_use", "id": "tool_1", "name": "run", "input": {"cmd": "ls"}},
+        {"type": "text", "text": "world"},
+    ],
+}
+
+
+def make_client(handler: Callable[[httpx.Request], httpx.Response]) -> AzureFoundryClient:
+    """Create a client whose HTTP traffic goes to a mock handler."""
+    client = AzureFoundryClient(
+        TriagentCredentials(
+            anthropic_foundry_api_key="test-key",
+            anthropic_foundry_base_url="https://res.services.ai.azure.com/anthropic/v1/messages",
+        )
+    )
+    client._client = httpx.Client(
+        transport=httpx.MockTransport(handler),
+        headers=client._headers,
+    )
+    return client
+
+
+def patch_async_clients(
+    client: AzureFoundryClient, monkeypatch: pytest.MonkeyPatch
+) -> list[httpx.AsyncClient]:
+    """Route async clients to a mock handler and record each one created."""
+    created: list[httpx.AsyncClient] = []
+
+    def new_async_client() -> httpx.AsyncClient:
+        aclient = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=orjson.dumps(RESPONSE))
+            ),
+            headers=client._headers,
+        )
+        created.append(aclient)
+        return aclient
+
+    monkeypatch.setattr(client, "_new_async_client", new_async_client)
+    return created
+
+
+class TestParseResponse:
+    """Tests for response parsing helpers."""
+
+    def test_parse_response(self) -> None:
+        """Test text and tool calls are extracted in one pass."""
+        client = make_client(lambda request: httpx.Response(200))
+        parsed = client.parse_response(RESPONSE)
+
+        assert parsed.text == "Hello world"
+        assert parsed.has_tool_calls is True
+        assert parsed.tool_calls == [
+            {"id": "tool_1", "name": "run", "arguments": {"cmd": "ls"}}
+        ]
+
+    def test_single_purpose_helpers_match_parse_response(self) -> None:
+        """Test extract_text, has_tool_calls and get_tool_calls agree with parse_response."""
+        client = make_client(lambda request: httpx.Response(200))
+        parsed = client.parse_response(RESPONSE)
+
+        assert client.extract_text(RESPONSE) == parsed.text
+        assert client.has_tool_calls(RESPONSE) is True
+        assert client.has_tool_calls({"content": [{"type": "text", "text": "x"}]}) is False
+        assert client.get_tool_calls(RESPONSE) == parsed.tool_calls
+
+    def test_parse_response_bytes_matches_dict_path(self) -> None:
+        """Test typed decoding gives the same result as the dict path."""
+        client = make_client(lambda request: httpx.Response(200))
+
+        assert client.parse_response_bytes(orjson.dumps(RESPONSE)) == (
+            client.parse_response(RESPONSE)
+        )
+
+    def test_parse_response_bytes_unknown_block(self) -> None:
+        """Test unknown block types fall back to the dict path."""
+        client = make_client(lambda request: httpx.Response(200))
+        raw = orjson.dumps(
+            {"content": [{"type": "thinking", "thinking": "..."}, {"type": "text", "text": "ok"}]}
+        )
+
+        parsed = client.parse_response_bytes(raw)
+
+        assert parsed.text == "ok"
+        assert parsed.has_tool_calls is False
+
+    def test_parse_response_bytes_without_msgspec(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the dict path is used when the optional msgspec is missing."""
+        monkeypatch.setattr(agent, "_HAS_MSGSPEC", False)
+        client = make_client(lambda request: httpx.Response(200))
+
+        assert client.parse_response_bytes(orjson.dumps(RESPONSE)) == (
+            client.parse_response(RESPONSE)
+        )
+
+
+class TestSendMessage:
+    """Tests for sending messages."""
+
+    def test_send_message(self) -> None:
+        """Test request body and headers, and response decoding."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = orjson.loads(request.content)
+            assert request.headers["x-api-key"] == "test-key"
+            assert body["system"] == "be brief"
+            assert "tools" not in body
+            return httpx.Response(200, content=orjson.dumps(RESPONSE))
+
+        client = make_client(handler)
+
+        assert client.send_message([{"role": "user", "content": "hi"}], system="be brief") == RESPONSE
+
+    def test_send_message_raises_on_error(self) -> None:
+        """Test HTTP errors are raised from send_message."""
+        client = make_client(lambda request: httpx.Response(500, text="boom"))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.send_message([{"role": "user", "content": "hi"}])
+
+    def test_send_message_with_error_info(self) -> None:
+        """Test HTTP errors are returned as ErrorContext."""
+        client = make_client(lambda request: httpx.Response(429, text="slow down"))
+
+        response, error = client.send_message_with_error_info([{"role": "user", "content": "hi"}])
+
+        assert response is None
+        assert error is not None
+        assert error.status_code == 429
+        assert error.error_message == "slow down"
+
+    def test_send_encoded_retries_same_payload(self) -> None:
+        """Test a pre-encoded payload is sent unchanged on each attempt."""
+        bodies: list[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            if len(bodies) == 1:
+                return httpx.Response(429, text="slow down")
+            return httpx.Response(200, content=orjson.dumps(RESPONSE))
+
+        client = make_client(handler)
+        payload = client.encode_request([{"role": "user", "content": "hi"}], max_tokens=10)
+
+        first, error = client.send_encoded_with_error_info(payload)
+        second, _ = client.send_encoded_with_error_info(payload)
+
+        assert first is None and error is not None
+        assert second == RESPONSE
+        assert bodies == [payload, payload]
+        assert orjson.loads(payload)["max_tokens"] == 10
+
+    def test_send_message_stream(self) -> None:
+        """Test streamed events are reassembled into a full response."""
+        events = [
+            {"type": "message_start", "message": {"id": "msg_1", "content": []}},
+            {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "H"}},
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "i"}},
+            {"type": "content_block_stop", "index": 0},
+            {
+                "type": "content_block_start",
+                "index": 1,
+                "content_block": {"type": "tool_use", "id": "t", "name": "run", "input": {}},
+            },
+            {
+                "type": "content_block_delta",
+                "index": 1,
+                "delta": {"type": "input_json_delta", "partial_json": '{"cmd": '},
+            },
+            {
+                "type": "content_block_delta",
+                "index": 1,
+                "delta": {"type": "input_json_delta", "partial_json": '"ls"}'},
+            },
+            {"type": "content_block_stop", "index": 1},
+            {"type": "message_stop"},
+        ]
+        stream = b"".join(b"data: " + orjson.dumps(event) + b"\n\n" for event in events)
+        client = make_client(lambda request: httpx.Response(200, content=stream))
+        deltas: list[dict] = []
+
+        response = client.send_message([], stream=True, on_delta=deltas.append)
+
+        assert len(deltas) == 4
+        assert response["id"] == "msg_1"
+        assert response["content"] == [
+            {"type": "text", "text": "Hi"},
+            {"type": "tool_use", "id": "t", "name": "run", "input": {"cmd": "ls"}},
+        ]
+
+
+class TestAsendMessage:
+    """Tests for the async send path."""
+
+    def test_separate_event_loops(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test calls from separate asyncio.run loops each get their own client."""
+        client = make_client(lambda request: httpx.Response(200))
+        created = patch_async_clients(client, monkeypatch)
+        messages = [{"role": "user", "content": "hi"}]
+
+        assert asyncio.run(client.asend_message(messages)) == RESPONSE
+        assert asyncio.run(client.asend_message(messages)) == RESPONSE
+        assert len(created) == 2
+        assert all(aclient.is_closed for aclient in created)
+
+    async def test_async_with_shares_one_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test concurrent calls inside async with reuse one client, closed on exit."""
+        client = make_client(lambda request: httpx.Response(200))
+        created = patch_async_clients(client, monkeypatch)
+        messages = [{"role": "user", "content": "hi"}]
+
+        async with client:
+            results = await asyncio.gather(
+                client.asend_message(messages), client.asend_message(messages)
+            )
+
+        assert results == [RESPONSE, RESPONSE]
+        assert len(created) == 1
+        assert created[0].is_closed
+        assert client._aclient is None
@@ -0,0 +1,70 @@
+"""Tests for Azure Foundry authentication helpers."""
+
+from pathlib import Path
+
+from triagent.auth import (
+    _extract_foundry_resource,
+    get_foundry_env,
+    get_foundry_env_from,
+)
+from triagent.config import ConfigManager, TriagentCredentials
+
+
+class TestExtractFoundryResource:
+    """Tests for _extract_foundry_resource function."""
+
+    def test_standard_foundry_url(self) -> None:
+        """Test resource name is taken from the host of a Foundry URL."""
+        url = "https://my-resource.services.ai.azure.com/anthropic/v1/messages"
+        assert _extract_foundry_resource(url) == "my-resource"
+
+    def test_bare_foundry_host(self) -> None:
+        """Test URL without a path still yields the resource name."""
+        assert _extract_foundry_resource("https://res.services.ai.azure.com") == "res"
+
+    def test_non_foundry_host_strips_suffix(self) -> None:
+        """Test non-Foundry URLs fall back to suffix stripping."""
+        url = "https://example.openai.azure.com/anthropic/v1/messages"
+        assert _extract_foundry_resource(url) == "https://example.openai.azure.com"
+
+    def test_pattern_not_at_start(self) -> None:
+        """Test Foundry pattern is still found when the URL has a prefix."""
+        url = " https://res.services.ai.azure.com/v1/messages"
+        assert _extract_foundry_resource(url) == "res"
+
+
+class TestGetFoundryEnv:
+    """Tests for get_foundry_env function."""
+
+    def test_returns_independent_copies(self) -> None:
+        """Test cached env is not mutated through a returned dict."""
+        creds = TriagentCredentials(
+            anthropic_foundry_api_key="key",
+            anthropic_foundry_base_url="https://res.services.ai.azure.com/anthropic",
+        )
+
+        env = get_foundry_env(creds)
+        env["EXTRA"] = "1"
+
+        assert "EXTRA" not in get_foundry_env(creds)
+        assert get_foundry_env(creds)["ANTHROPIC_FOUNDRY_RESOURCE"] == "res"
+
+    def test_credentials_change_is_picked_up(self) -> None:
+        """Test a different API key produces a fresh env."""
+        assert get_foundry_env(TriagentCredentials(anthropic_foundry_api_key="old"))[
+            "ANTHROPIC_FOUNDRY_API_KEY"
+        ] == "old"
+        assert get_foundry_env(TriagentCredentials(anthropic_foundry_api_key="new"))[
+            "ANTHROPIC_FOUNDRY_API_KEY"
+        ] == "new"
+
+    def test_anthropic_provider_has_no_env(self) -> None:
+        """Test direct Anthropic provider needs no Foundry env vars."""
+        assert get_foundry_env(TriagentCredentials(api_provider="anthropic")) == {}
+
+    def test_from_config_manager(self, isolated_config_dir: Path) -> None:
+        """Test wrapper loads credentials from the config manager."""
+        manager = ConfigManager(config_dir=isolated_config_dir)
+        manager.save_credentials(TriagentCredentials(anthropic_foundry_api_key="saved"))
+
+        assert get_foundry_env_from(manager)["ANTHROPIC_FOUNDRY_API_KEY"] == "saved"
@@ -0,0 +1,38 @@
+"""Tests for the Azure CLI tool."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from triagent.tools.azure_cli import execute_azure_cli_sdk
+
+
+@pytest.fixture
+def fake_az(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Put a stub az script first on PATH that echoes its telemetry setting."""
+    script = tmp_path / "az"
+    script.write_text('#!/bin/sh\necho "$AZURE_CORE_COLLECT_TELEMETRY $*"\n')
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    return script
+
+
+class TestExecuteAzureCliSdk:
+    """Tests for the SDK Azure CLI tool."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fake az is a POSIX shell script")
+    async def test_runs_az_command(self, fake_az: Path) -> None:
+        """Test az output is returned with telemetry disabled."""
+        result = await execute_azure_cli_sdk.handler({"command": "az repos list --top 1"})
+
+        assert "is_error" not in result
+        assert result["content"][0]["text"].strip() == "no repos list --top 1"
+
+    async def test_rejects_non_az_command(self) -> None:
+        """Test commands other than az are refused."""
+        result = await execute_azure_cli_sdk.handler({"command": "rm -rf /"})
+
+        assert result["is_error"] is True
+
@@ -0,0 +1,60 @@
+"""Tests for the interactive CLI message handling."""
+
+from claude_agent_sdk import AssistantMessage, SystemMessage, TextBlock, ToolUseBlock
+from rich.console import Console
+
+from triagent.cli import ActivityTracker, process_sdk_message
+
+
+class TestProcessSdkMessage:
+    """Tests for process_sdk_message function."""
+
+    def test_assistant_blocks_dispatched_by_class(self) -> None:
+        """Test text is buffered and tool use starts tracking."""
+        console = Console(quiet=True)
+        tracker = ActivityTracker(console=console, markdown_enabled=True)
+        msg = AssistantMessage(
+            content=[
+                TextBlock(text="partial answer"),
+                ToolUseBlock(id="tool_1", name="Bash", input={"command": "ls"}),
+            ],
+            model="claude",
+        )
+
+        process_sdk_message(msg, console, tracker)
+        tracker.stop()
+
+        assert tracker._text_buffer == "partial answer"
+        assert tracker._current_tool == "Bash"
+        assert tracker._current_tool_id == "tool_1"
+
+    def test_system_command_result_printed(self) -> None:
+        """Test SDK slash command output is shown."""
+        console = Console(record=True, width=80)
+        tracker = ActivityTracker(console=console)
+
+        process_sdk_message(
+            SystemMessage(subtype="command_result", data={"output": "done"}),
+            console,
+            tracker,
+        )
+
+        assert "done" in console.export_text()
+
+
+class TestActivityTrackerBufferText:
+    """Tests for ActivityTracker markdown buffering."""
+
+    def test_paragraph_split_across_chunks(self) -> None:
+        """Test a break split over two chunks still flushes the paragraph."""
+        console = Console(record=True, width=80)
+        tracker = ActivityTracker(console=console, markdown_enabled=True)
+
+        tracker.buffer_text("first")
+        tracker.buffer_text(" para\n")
+        assert console.export_text(clear=False) == ""
+
+        tracker.buffer_text("\nsecond")
+
+        assert "first para" in console.export_text()
+        assert tracker._text_buffer == "second"
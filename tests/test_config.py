@@ -1,5 +1,6 @@
 """Tests for configuration management."""
 
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -81,6 +82,22 @@ class TestConfigManager:
 
             assert manager.config_exists() is True
 
+    def test_load_config_cached_until_file_changes(self) -> None:
+        """Test cached config is reused and refreshed on external edits."""
+        with TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir) / ".triagent"
+            manager = ConfigManager(config_dir=config_dir)
+            manager.save_config(TriagentConfig(team="omnia"))
+
+            assert manager.load_config() is manager.load_config()
+
+            # Another process rewrites the file
+            other = ConfigManager(config_dir=config_dir)
+            other.save_config(TriagentConfig(team="levvia"))
+            os.utime(manager.config_file, ns=(0, manager._config_mtime_ns + 1))
+
+            assert manager.load_config().team == "levvia"
+
 
 class TestTriagentCredentials:
     """Tests for TriagentCredentials."""
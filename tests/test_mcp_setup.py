@@ -0,0 +1,46 @@
+"""Tests for MCP and Azure CLI setup helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from triagent.mcp.setup import clear_azure_account_cache, get_azure_account
+
+
+@pytest.fixture(autouse=True)
+def clear_account_cache() -> Generator[None, None, None]:
+    """Reset the cached Azure account around each test."""
+    clear_azure_account_cache()
+    yield
+    clear_azure_account_cache()
+
+
+class TestGetAzureAccount:
+    """Tests for get_azure_account function."""
+
+    @patch("triagent.mcp.setup._find_az_command", return_value="az")
+    @patch("subprocess.run")
+    def test_result_is_reused_within_ttl(
+        self, mock_run: MagicMock, mock_find: MagicMock
+    ) -> None:
+        """Test az is only spawned once for back-to-back checks."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b'{"user": {"name": "ada"}}')
+
+        assert get_azure_account() == {"user": {"name": "ada"}}
+        assert get_azure_account() == {"user": {"name": "ada"}}
+        mock_run.assert_called_once()
+
+    @patch("triagent.mcp.setup._find_az_command", return_value="az")
+    @patch("subprocess.run")
+    def test_cache_cleared(self, mock_run: MagicMock, mock_find: MagicMock) -> None:
+        """Test clearing the cache forces a fresh lookup."""
+        mock_run.return_value = MagicMock(returncode=1, stdout=b"")
+        assert get_azure_account() is None
+
+        clear_azure_account_cache()
+        mock_run.return_value = MagicMock(returncode=0, stdout=b'{"id": "sub"}')
+
+        assert get_azure_account() == {"id": "sub"}
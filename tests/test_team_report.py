@@ -0,0 +1,351 @@
+"""Tests for the team report command."""
+
+from pathlib import Path
+
+import httpx
+import orjson
+import pytest
+from rich.console import Console
+
+from triagent.commands import team_report
+from triagent.commands.team_report import (
+    fetch_team_data,
+    fetch_teams_data,
+    generate_progress_bar,
+    get_pod_for_team,
+    identify_roles,
+    save_report_to_file,
+    summarize_work_items,
+)
+
+ITERATIONS = {
+    "value": [
+        {
+            "name": "Sprint 1",
+            "path": "Audit Cortex 2\\Sprint 1",
+            "attributes": {"timeFrame": "current"},
+        }
+    ]
+}
+MEMBERS = {"value": [{"identity": {"displayName": "Ada"}, "isTeamAdmin": True}]}
+
+
+@pytest.fixture
+def queued_responses() -> list[httpx.Response]:
+    """Responses the mock transport returns before its normal routing."""
+    return []
+
+
+@pytest.fixture
+def ado_requests(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    queued_responses: list[httpx.Response],
+) -> list[httpx.Request]:
+    """Route Azure DevOps REST calls to a mock transport and record them."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if queued_responses:
+            return queued_responses.pop(0)
+        path = request.url.path
+        if path.endswith("/teamsettings/iterations"):
+            return httpx.Response(200, json=ITERATIONS)
+        if path.endswith("/members"):
+            return httpx.Response(200, json=MEMBERS)
+        if path.endswith("/wiql"):
+            return httpx.Response(200, json={"workItems": [{"id": 1}, {"id": 2}]})
+        if path.endswith("/workitemsbatch"):
+            ids = orjson.loads(request.content)["ids"]
+            return httpx.Response(
+                200, json={"value": [{"id": i, "fields": {"System.Title": "t"}} for i in ids]}
+            )
+        return httpx.Response(404)
+
+    async def get_token(console: Console | None = None) -> str:
+        return "token"
+
+    def create_client(token: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=f"{team_report.ORG_URL}/",
+            transport=httpx.MockTransport(handler),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    monkeypatch.setattr(team_report, "get_access_token", get_token)
+    monkeypatch.setattr(team_report, "_create_ado_client", create_client)
+    monkeypatch.setattr(team_report, "ADO_CACHE_DIR", tmp_path / "ado")
+    monkeypatch.setattr(team_report, "_iteration_memo", {})
+    return requests
+
+
+class TestGetAccessToken:
+    """Tests for get_access_token function."""
+
+    async def test_runs_resolved_az_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test az is run by its full path so az.cmd works without a shell."""
+        calls: list[list[str]] = []
+
+        async def run_az(args: list[str], console: Console | None = None) -> dict:
+            calls.append(args)
+            return {"accessToken": "tok", "expires_on": 4102444800}
+
+        monkeypatch.setattr(team_report, "_access_token", None)
+        monkeypatch.setattr(team_report, "_find_az_command", lambda: "az")
+        monkeypatch.setattr(team_report.shutil, "which", lambda cmd: r"C:\az\bin\az.cmd")
+        monkeypatch.setattr(team_report, "run_az_command_async", run_az)
+
+        assert await team_report.get_access_token() == "tok"
+        assert calls[0][0] == r"C:\az\bin\az.cmd"
+
+    async def test_missing_az_reported_separately(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a missing Azure CLI is not reported as a login problem."""
+        console = Console(record=True, width=120)
+        monkeypatch.setattr(team_report, "_access_token", None)
+        monkeypatch.setattr(team_report, "_find_az_command", lambda: None)
+
+        assert await team_report.get_access_token(console) is None
+        output = console.export_text()
+        assert "Azure CLI (az) not found" in output
+        assert "Could not get" not in output
+
+
+class TestFetchTeamData:
+    """Tests for fetch_team_data function."""
+
+    async def test_fetches_iteration_members_and_work_items(
+        self, ado_requests: list[httpx.Request]
+    ) -> None:
+        """Test all three lookups are served from the REST API."""
+        iteration, members, work_items = await fetch_team_data(
+            "Alpha", team_report.TEAM_AREA_PATHS["alpha"], Console(quiet=True)
+        )
+
+        assert iteration == ("Audit Cortex 2\\Sprint 1", "Sprint 1")
+        assert members == MEMBERS["value"]
+        assert [item["id"] for item in work_items] == [1, 2]
+        assert all(r.headers["Authorization"] == "Bearer token" for r in ado_requests)
+
+    async def test_no_current_iteration(
+        self, ado_requests: list[httpx.Request], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test work items are not queried without a current iteration."""
+        monkeypatch.setitem(ITERATIONS["value"][0]["attributes"], "timeFrame", "past")
+
+        iteration, _, work_items = await fetch_team_data("Alpha", "Area", Console(quiet=True))
+
+        assert iteration is None
+        assert work_items == []
+        assert not any(r.url.path.endswith("/wiql") for r in ado_requests)
+
+    async def test_metadata_served_from_disk_cache(
+        self, ado_requests: list[httpx.Request]
+    ) -> None:
+        """Test a second report reuses cached iteration and member data."""
+        console = Console(quiet=True)
+        first = await fetch_team_data("Alpha", "Area", console)
+        ado_requests.clear()
+
+        second = await fetch_team_data("alpha", "Area", console)
+
+        assert second == first
+        assert [r.url.path.rsplit("/", 1)[-1] for r in ado_requests] == [
+            "wiql",
+            "workitemsbatch",
+        ]
+
+    async def test_refresh_bypasses_caches(self, ado_requests: list[httpx.Request]) -> None:
+        """Test refresh re-fetches iteration and members despite cached copies."""
+        console = Console(quiet=True)
+        await fetch_team_data("Alpha", "Area", console)
+        ado_requests.clear()
+
+        await fetch_team_data("Alpha", "Area", console, refresh=True)
+
+        paths = {r.url.path.rsplit("/", 1)[-1] for r in ado_requests}
+        assert {"iterations", "members"} <= paths
+
+    async def test_work_items_fetched_in_batches(
+        self, ado_requests: list[httpx.Request], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test work item fields are fetched in order across several batches."""
+        monkeypatch.setattr(team_report, "WORK_ITEM_BATCH_SIZE", 1)
+
+        _, _, work_items = await fetch_team_data("Alpha", "Area", Console(quiet=True))
+
+        batch_requests = [r for r in ado_requests if r.url.path.endswith("/workitemsbatch")]
+        assert [item["id"] for item in work_items] == [1, 2]
+        assert len(batch_requests) == 2
+        assert orjson.loads(batch_requests[0].content)["fields"] == team_report.WORK_ITEM_FIELDS
+
+    async def test_rate_limited_request_is_retried(
+        self, ado_requests: list[httpx.Request], queued_responses: list[httpx.Response]
+    ) -> None:
+        """Test a 429 response is retried after Retry-After."""
+        queued_responses.append(httpx.Response(429, headers={"Retry-After": "0"}))
+
+        iteration, members, _ = await fetch_team_data("Alpha", "Area", Console(quiet=True))
+
+        assert len(ado_requests) == 5
+        assert members == MEMBERS["value"]
+        assert iteration == ("Audit Cortex 2\\Sprint 1", "Sprint 1")
+
+    async def test_non_json_success_response(
+        self, ado_requests: list[httpx.Request], queued_responses: list[httpx.Response]
+    ) -> None:
+        """Test a 2xx HTML sign-in page is treated as a failed lookup."""
+        queued_responses.append(
+            httpx.Response(203, text="<html>Sign in</html>", headers={"Content-Type": "text/html"})
+        )
+
+        iteration, members, work_items = await fetch_team_data(
+            "Alpha", "Area", Console(quiet=True)
+        )
+
+        assert iteration is None
+        assert members == MEMBERS["value"]
+        assert work_items == []
+
+
+class TestDiskCache:
+    """Tests for the Azure DevOps response disk cache."""
+
+    def test_round_trip_and_corrupt_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test cached data reads back and an unreadable file counts as a miss."""
+        monkeypatch.setattr(team_report, "ADO_CACHE_DIR", tmp_path)
+        key = ("org", "members", "Alpha")
+
+        team_report._write_cache(key, MEMBERS)
+        assert team_report._read_cache(key, ttl=60) == MEMBERS
+
+        team_report._cache_path(key).write_bytes(b"{not json")
+        assert team_report._read_cache(key, ttl=60) is None
+
+
+class TestFetchTeamsData:
+    """Tests for fetch_teams_data function."""
+
+    async def test_results_in_team_order(self, ado_requests: list[httpx.Request]) -> None:
+        """Test several teams are fetched and returned in request order."""
+        results = await fetch_teams_data(["Alpha", "Justice League"], Console(quiet=True))
+
+        assert len(results) == 2
+        assert all(iteration == ("Audit Cortex 2\\Sprint 1", "Sprint 1") for iteration, _, _ in results)
+        assert any("Justice%20League" in str(r.url) for r in ado_requests)
+
+
+class TestIdentifyRoles:
+    """Tests for identify_roles function."""
+
+    def test_roles_from_task_titles(self) -> None:
+        """Test admins, QA and developers are identified case-insensitively."""
+        members = [
+            {"identity": {"displayName": name}, "isTeamAdmin": name == "Ada"}
+            for name in ("Ada", "Bob", "Cy", "Dee")
+        ]
+        tasks = [
+            {"title": "[qa task] regression", "assigned_to": "Bob"},
+            {"title": "Code review for login", "assigned_to": "Cy"},
+            {"title": "[Dev-BE] api", "assigned_to": "Ada"},
+        ]
+
+        roles = identify_roles(members, tasks)
+
+        assert [m["name"] for m in roles["admins"]] == ["Ada"]
+        assert [m["name"] for m in roles["qa"]] == ["Bob"]
+        assert [m["name"] for m in roles["developers"]] == ["Cy"]
+        assert [m["name"] for m in roles["other"]] == ["Dee"]
+
+    def test_regex_fallback_matches_like_automaton(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the regex fallback matches the same titles."""
+        monkeypatch.setattr(team_report, "ahocorasick", None)
+        match = team_report._build_title_matcher(team_report.QA_TASK_PATTERNS)
+
+        assert match("Run TEST CASE suite")
+        assert not match("Implementation")
+
+
+class TestGetPodForTeam:
+    """Tests for get_pod_for_team function."""
+
+    def test_lookup_is_case_insensitive(self) -> None:
+        """Test POD is found regardless of team name casing."""
+        assert get_pod_for_team("justice league") == "Omnia JE"
+        assert get_pod_for_team("MEGATRON") == "Data Acquisition and Preparation"
+
+    def test_unknown_team(self) -> None:
+        """Test unknown teams map to Unknown."""
+        assert get_pod_for_team("nobody") == "Unknown"
+
+
+class TestSaveReportToFile:
+    """Tests for save_report_to_file function."""
+
+    def test_writes_utf8_report(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test report is written in full with no temporary file left behind."""
+        monkeypatch.chdir(tmp_path)
+
+        save_report_to_file("# Report █░\n", "Justice League", Console(quiet=True))
+
+        files = list((tmp_path / "docs" / "reports").iterdir())
+        assert len(files) == 1
+        assert files[0].name.startswith("justice-league-report-")
+        assert files[0].read_text(encoding="utf-8") == "# Report █░\n"
+
+
+class TestSummarizeWorkItems:
+    """Tests for summarize_work_items function."""
+
+    def test_single_pass_summary(self) -> None:
+        """Test counts and side lists are collected together."""
+        items = [
+            {"id": 1, "state": "Done", "assigned_to": "Ada", "priority": 1},
+            {"id": 2, "state": "Blocked", "assigned_to": "Unassigned", "priority": 1},
+            {"id": 3, "state": "Closed", "assigned_to": "Unassigned", "priority": 2},
+            {"id": 4, "state": "Active", "assigned_to": "Bob", "priority": 1},
+        ]
+
+        states, done, active, blocked, unassigned_p1 = summarize_work_items(items)
+
+        assert states == {"Done": 1, "Blocked": 1, "Closed": 1, "Active": 1}
+        assert done == 2
+        assert [i["id"] for i in active] == [2, 4]
+        assert [i["id"] for i in blocked] == [2]
+        assert [i["id"] for i in unassigned_p1] == [2]
+
+
+class TestGenerateProgressBar:
+    """Tests for generate_progress_bar function."""
+
+    def test_partial(self) -> None:
+        """Test filled and empty segments add up to the width."""
+        assert generate_progress_bar(1, 4, width=8) == "██░░░░░░ 25%"
+
+    def test_empty_total(self) -> None:
+        """Test zero total renders an empty bar."""
+        assert generate_progress_bar(0, 0, width=4) == "░░░░ 0%"
+
+    def test_wider_than_precomputed(self) -> None:
+        """Test widths beyond the precomputed segments still render fully."""
+        assert generate_progress_bar(1, 1, width=100) == "█" * 100 + " 100%"
+
+
+class TestEscapeTableCell:
+    """Tests for _escape_table_cell function."""
+
+    def test_pipes_and_newlines_escaped(self) -> None:
+        """Test titles cannot split or end a markdown table row."""
+        assert team_report._escape_table_cell("a | b\nc") == "a \\| b c"
+
+    def test_plain_text_unchanged(self) -> None:
+        """Test ordinary titles are returned as is."""
+        assert team_report._escape_table_cell("Fix login") == "Fix login"
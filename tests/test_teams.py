@@ -48,6 +48,13 @@ class TestGetTeamConfig:
         assert config is not None
         assert config.name == "omnia-data"
 
+    def test_surrounding_whitespace_ignored(self) -> None:
+        """Test team lookup ignores surrounding whitespace."""
+        config = get_team_config("  Omnia  ")
+
+        assert config is not None
+        assert config.name == "omnia"
+
 
 class TestGetTeamNames:
     """Tests for team name functions."""
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from triagent.utils.windows import (
     check_winget_available,
     find_git_bash,
@@ -14,28 +17,37 @@ from triagent.utils.windows import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_lookup_caches() -> Generator[None, None, None]:
+    """Reset the cached git bash and winget lookups around each test."""
+    find_git_bash.cache_clear()
+    check_winget_available.cache_clear()
+    yield
+    find_git_bash.cache_clear()
+    check_winget_available.cache_clear()
+
+
 class TestIsWindows:
     """Tests for is_windows function."""
 
-    @patch("platform.system")
-    def test_is_windows_true(self, mock_system: MagicMock) -> None:
+    @patch("triagent.utils.windows._IS_WINDOWS", True)
+    def test_is_windows_true(self) -> None:
         """Test that is_windows returns True on Windows."""
-        mock_system.return_value = "Windows"
         assert is_windows() is True
 
-    @patch("platform.system")
-    def test_is_windows_false_darwin(self, mock_system: MagicMock) -> None:
-        """Test that is_windows returns False on macOS."""
-        mock_system.return_value = "Darwin"
+    @patch("triagent.utils.windows._IS_WINDOWS", False)
+    def test_is_windows_false(self) -> None:
+        """Test that is_windows returns False on other platforms."""
         assert is_windows() is False
 
-    @patch("platform.system")
-    def test_is_windows_false_linux(self, mock_system: MagicMock) -> None:
-        """Test that is_windows returns False on Linux."""
-        mock_system.return_value = "Linux"
-        assert is_windows() is False
+    def test_matches_sys_platform(self) -> None:
+        """Test that the cached value reflects sys.platform."""
+        import sys
+
+        assert is_windows() is (sys.platform == "win32")
 
 
+@patch("triagent.utils.windows._IS_WINDOWS", True)
 class TestFindGitBash:
     """Tests for find_git_bash function."""
 
@@ -78,11 +90,11 @@ class TestFindGitBash:
         """Test fallback to common installation paths."""
         mock_which.return_value = None  # git not in PATH
 
-        def mock_exists(path: Path) -> bool:
+        def mock_isfile(path: str) -> bool:
             # Only the first common path exists
-            return str(path) == r"C:\Program Files\Git\bin\bash.exe"
+            return path == r"C:\Program Files\Git\bin\bash.exe"
 
-        with patch.object(Path, "exists", mock_exists):
+        with patch("os.path.isfile", mock_isfile):
             result = find_git_bash()
 
         assert result == r"C:\Program Files\Git\bin\bash.exe"
@@ -115,6 +127,31 @@ class TestFindGitBash:
         mock_which.return_value = None
         assert find_git_bash() is None
 
+    @patch("shutil.which")
+    def test_result_is_cached(
+        self, mock_which: MagicMock, clean_env_preserve_home: None
+    ) -> None:
+        """Test the lookup runs once until the cache is cleared."""
+        mock_which.side_effect = lambda cmd: "/usr/bin/bash" if cmd == "bash" else None
+
+        with patch.object(Path, "exists", return_value=False):
+            assert find_git_bash() == "/usr/bin/bash"
+            calls = mock_which.call_count
+            assert find_git_bash() == "/usr/bin/bash"
+
+        assert mock_which.call_count == calls
+
+
+class TestFindGitBashNonWindows:
+    """Tests for find_git_bash off Windows."""
+
+    @patch("triagent.utils.windows._IS_WINDOWS", False)
+    @patch("shutil.which")
+    def test_skips_lookup(self, mock_which: MagicMock) -> None:
+        """Test no lookup is attempted on other platforms."""
+        assert find_git_bash() is None
+        mock_which.assert_not_called()
+
 
 class TestGetGitBashEnv:
     """Tests for get_git_bash_env function."""
@@ -136,6 +173,7 @@ class TestGetGitBashEnv:
         assert result == {}
 
 
+@patch("shutil.which", MagicMock(return_value=r"C:\winget.exe"))
 class TestCheckWingetAvailable:
     """Tests for check_winget_available function."""
 
@@ -165,6 +203,21 @@ class TestCheckWingetAvailable:
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="winget", timeout=10)
         assert check_winget_available() is False
 
+    @patch("subprocess.run")
+    def test_result_is_cached(self, mock_run: MagicMock) -> None:
+        """Test winget is only spawned once."""
+        mock_run.return_value = MagicMock(returncode=0)
+        assert check_winget_available() is True
+        assert check_winget_available() is True
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_winget_not_on_path(self, mock_run: MagicMock) -> None:
+        """Test no process is spawned when winget isn't on PATH."""
+        with patch("shutil.which", return_value=None):
+            assert check_winget_available() is False
+        mock_run.assert_not_called()
+
 
 class TestInstallGitWindows:
     """Tests for install_git_windows function."""